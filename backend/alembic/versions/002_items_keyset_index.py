@@ -0,0 +1,24 @@
+"""Add composite index for keyset pagination
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_items_created_at_id", "items", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_items_created_at_id", table_name="items")
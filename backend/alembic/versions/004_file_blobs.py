@@ -0,0 +1,55 @@
+"""Add file_blobs table for content-addressed uploads
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "file_blobs",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("storage_key", sa.String(length=512), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_referenced_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("sha256"),
+    )
+    op.create_index(
+        op.f("ix_item_files_sha256"), "item_files", ["sha256"], unique=False
+    )
+    # Existing uploads become blobs; duplicates keep their own objects
+    op.execute(
+        """
+        INSERT INTO file_blobs (sha256, size, storage_key)
+        SELECT DISTINCT ON (sha256) sha256, size, storage_key
+        FROM item_files
+        ORDER BY sha256, id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_item_files_sha256"), table_name="item_files")
+    op.drop_table("file_blobs")
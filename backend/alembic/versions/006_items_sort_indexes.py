@@ -0,0 +1,49 @@
+"""Add composite and partial indexes for item filtering and sorting
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+# Partial indexes for the default active-only lists, one per sort column
+ACTIVE_INDEXES = {
+    "ix_items_active_id": ["id"],
+    "ix_items_active_title_id": ["title", "id"],
+    "ix_items_active_created_at_id": ["created_at", "id"],
+    "ix_items_active_updated_at_id": ["updated_at", "id"],
+}
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_items_updated_at_id", "items", ["updated_at", "id"], unique=False
+    )
+    op.create_index("ix_items_title_id", "items", ["title", "id"], unique=False)
+    # Superseded by ix_items_title_id, which has title as its leading column
+    op.drop_index("ix_items_title", table_name="items")
+    for name, columns in ACTIVE_INDEXES.items():
+        op.create_index(
+            name,
+            "items",
+            columns,
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+        )
+
+
+def downgrade() -> None:
+    for name in ACTIVE_INDEXES:
+        op.drop_index(name, table_name="items")
+    op.create_index("ix_items_title", "items", ["title"], unique=False)
+    op.drop_index("ix_items_title_id", table_name="items")
+    op.drop_index("ix_items_updated_at_id", table_name="items")
@@ -0,0 +1,67 @@
+"""Notify item_changes listeners on item writes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+# One NOTIFY per statement, not per row; NOTIFYs are delivered on commit
+# and identical ones in a transaction are merged. Payloads match
+# app.core.events.item_event, including its MAX_EVENT_IDS cut-off.
+NOTIFY_FUNCTION = """
+CREATE FUNCTION notify_item_changes() RETURNS trigger AS $$
+DECLARE
+    event_type text := CASE TG_OP
+        WHEN 'INSERT' THEN 'created'
+        WHEN 'UPDATE' THEN 'updated'
+        ELSE 'deleted'
+    END;
+    ids integer[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(id ORDER BY id) INTO ids FROM old_rows;
+    ELSE
+        SELECT array_agg(id ORDER BY id) INTO ids FROM new_rows;
+    END IF;
+    IF ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+    PERFORM pg_notify(
+        'item_changes',
+        json_build_object(
+            'type', event_type,
+            'ids', CASE WHEN cardinality(ids) <= 500 THEN to_json(ids) END
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+    for operation, table in [
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ]:
+        op.execute(
+            f"CREATE TRIGGER items_notify_{operation.lower()} "
+            f"AFTER {operation} ON items REFERENCING {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION notify_item_changes()"
+        )
+
+
+def downgrade() -> None:
+    for operation in ["insert", "update", "delete"]:
+        op.execute(f"DROP TRIGGER items_notify_{operation} ON items")
+    op.execute("DROP FUNCTION notify_item_changes()")
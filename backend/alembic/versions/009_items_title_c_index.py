@@ -0,0 +1,37 @@
+"""Add code point ordered title indexes for prefix filters
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+# title_prefix filters bound titles on both sides under the "C" collation,
+# where a prefix's matches are one contiguous range; see
+# app.repositories.item._title_prefix
+TITLE_C = sa.text('title COLLATE "C"')
+
+
+def upgrade() -> None:
+    op.create_index("ix_items_title_c_id", "items", [TITLE_C, "id"], unique=False)
+    op.create_index(
+        "ix_items_active_title_c_id",
+        "items",
+        [TITLE_C, "id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_items_active_title_c_id", table_name="items")
+    op.drop_index("ix_items_title_c_id", table_name="items")
@@ -1,4 +1,4 @@
 """
 API routes package.
 """
-from . import frontend, health, items, items_with_file
+from . import frontend, health, items, items_with_file, metrics
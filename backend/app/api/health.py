@@ -5,7 +5,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import get_item_cache
+from app.core.config import settings
+from app.core.database import async_engine, get_db, pool_metrics
+from app.core.health import health_prober
+from app.core.responses import ORJSONResponse
 
 router = APIRouter()
 
@@ -16,9 +20,34 @@ async def health_check():
     return {"status": "healthy", "message": "Vibe Boilerplate API is running"}
 
 
+@router.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and its event loop responsive."""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe, answered from the background prober's latest result.
+
+    Returns 503 while the database is unreachable, the result is stale, or
+    requests wait longer than HEALTH_MAX_POOL_WAIT for a pooled connection.
+    """
+    ready = health_prober.is_ready()
+    return ORJSONResponse(
+        {"status": "ready" if ready else "unavailable", **health_prober.snapshot()},
+        status_code=200 if ready else 503,
+    )
+
+
 @router.get("/health/db")
 async def database_health_check(db: AsyncSession = Depends(get_db)):
-    """Database health check endpoint."""
+    """
+    Database health check endpoint.
+
+    Runs a query on every call; point orchestrator probes at /health/ready.
+    """
     try:
         # Test database connection
         result = await db.execute(text("SELECT 1"))
@@ -36,3 +65,21 @@ async def database_health_check(db: AsyncSession = Depends(get_db)):
             "database": "disconnected",
             "error": str(e),
         }
+
+
+@router.get("/health/db/pool")
+async def database_pool_metrics():
+    """Connection pool occupancy and checkout latency for this process."""
+    return pool_metrics(async_engine)
+
+
+@router.get("/health/cache")
+async def cache_health_check():
+    """Item cache hit/miss counters for this process."""
+    if not settings.ITEM_CACHE_ENABLED:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "backend": settings.ITEM_CACHE_BACKEND,
+        **get_item_cache().stats(),
+    }
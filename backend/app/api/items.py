@@ -2,15 +2,56 @@
 Items API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+import contextlib
+import re
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+import orjson
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional import (
+    content_etag,
+    has_validators,
+    is_not_modified,
+    not_modified,
+    validator_headers,
+)
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
-from app.services.item import ItemService
+from app.core.events import EventBroadcaster, Subscription, get_item_events
+from app.core.replicas import get_read_db
+from app.core.responses import ORJSONResponse
+from app.schemas.item import (
+    DEFAULT_SORT,
+    ItemBulkDelete,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilter,
+    ItemResponse,
+    ItemSort,
+    ItemUpdate,
+)
+from app.services.item import ItemService, VersionConflict
+from app.services.item_export import MEDIA_TYPES, ExportFormat
 
 router = APIRouter()
 
+# Strong item ETags are '"<id>-<version>"'; weak ones never satisfy If-Match
+_ITEM_ETAG = re.compile(r'"(?P<id>\d+)-(?P<version>\d+)"')
+
 
 @router.post("/items", response_model=ItemResponse, status_code=201)
 async def create_item(item_data: ItemCreate, db: AsyncSession = Depends(get_db)):
@@ -19,48 +60,379 @@ async def create_item(item_data: ItemCreate, db: AsyncSession = Depends(get_db))
     return await service.create_item(item_data)
 
 
+def chunk_size_query(
+    chunk_size: int = Query(
+        settings.BULK_CHUNK_SIZE,
+        ge=1,
+        le=10000,
+        description="Rows per statement and transaction",
+    ),
+) -> int:
+    """Shared `chunk_size` query parameter for bulk endpoints."""
+    return chunk_size
+
+
+def _item_etag(item_id: int, version: int, fields: list[str] | None = None) -> str:
+    """
+    Item ETag; sparse fieldsets get a weak tag naming the fields.
+
+    Fields are sorted since they are always returned in column order, so
+    each distinct representation of a version has its own tag.
+    """
+    if not fields:
+        return f'"{item_id}-{version}"'
+    return f'W/"{item_id}-{version}-{".".join(sorted(fields))}"'
+
+
+def _etag_version(if_match: str, item_id: int) -> int | None:
+    """Version named by a strong item ETag in If-Match, or None if there is none."""
+    for tag in if_match.split(","):
+        match = _ITEM_ETAG.fullmatch(tag.strip())
+        if match and int(match["id"]) == item_id:
+            return int(match["version"])
+    return None
+
+
+def fields_query(
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return, e.g. title,is_active; "
+        "id is always included",
+    ),
+) -> list[str] | None:
+    """Shared sparse fieldset query parameter for item reads."""
+    names = [name.strip() for name in (fields or "").split(",") if name.strip()]
+    unknown = set(names) - set(ItemResponse.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return list(dict.fromkeys(names)) or None
+
+
+def item_filter_query(
+    title_prefix: str | None = Query(
+        None, min_length=1, max_length=255, description="Case-sensitive title prefix"
+    ),
+    created_after: datetime | None = Query(None, description="Created at or after"),
+    created_before: datetime | None = Query(None, description="Created before"),
+    updated_after: datetime | None = Query(None, description="Updated at or after"),
+    updated_before: datetime | None = Query(None, description="Updated before"),
+    is_active: bool | None = Query(None, description="Filter by active flag"),
+) -> ItemFilter:
+    """Item list filters from query parameters."""
+    return ItemFilter(
+        title_prefix=title_prefix,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        is_active=is_active,
+    )
+
+
+@router.post("/items/bulk", response_model=list[ItemResponse], status_code=201)
+async def bulk_create_items(
+    items: list[ItemCreate],
+    chunk_size: int = Depends(chunk_size_query),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create many items. Chunks are committed independently."""
+    service = ItemService(db)
+    return await service.bulk_create_items(items, chunk_size=chunk_size)
+
+
+@router.patch("/items/bulk", response_model=list[ItemResponse])
+async def bulk_update_items(
+    items: list[ItemBulkUpdate],
+    chunk_size: int = Depends(chunk_size_query),
+    db: AsyncSession = Depends(get_db),
+):
+    """Update many items by ID. Unknown IDs are skipped."""
+    service = ItemService(db)
+    return await service.bulk_update_items(items, chunk_size=chunk_size)
+
+
+@router.delete("/items/bulk", response_model=dict)
+async def bulk_delete_items(
+    payload: ItemBulkDelete,
+    chunk_size: int = Depends(chunk_size_query),
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete many items by ID."""
+    service = ItemService(db)
+    deleted = await service.bulk_delete_items(payload.ids, chunk_size=chunk_size)
+    return {"deleted": deleted}
+
+
 @router.get("/items/count", response_model=dict)
 async def get_item_count(
     active_only: bool = Query(True, description="Count only active items"),
-    db: AsyncSession = Depends(get_db),
+    approximate: bool = Query(
+        False, description="Use the database's row estimate instead of counting"
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get total item count."""
     service = ItemService(db)
-    count = await service.get_item_count(active_only=active_only)
+    count = await service.get_item_count(
+        active_only=active_only, approximate=approximate
+    )
     return {"count": count}
 
 
+@router.get("/items/export", response_class=StreamingResponse)
+async def export_items(
+    export_format: ExportFormat = Query(
+        "ndjson", alias="format", description="Output format: ndjson or csv"
+    ),
+    active_only: bool = Query(True, description="Export only active items"),
+    gzip: bool = Query(False, description="Gzip the export on the fly"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream every item as a file download without buffering the table."""
+    # Server-side cursors need a transaction, so no autocommit read session
+    service = ItemService(db)
+    filename = f"items.{export_format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        service.export_items(export_format, active_only=active_only, compress=gzip),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+async def _event_stream(
+    events: EventBroadcaster, heartbeat: float
+) -> AsyncIterator[bytes]:
+    """Server-sent events from a new subscription, with keep-alive comments."""
+    async with events.subscribe() as subscription:
+        # Once this arrives the client is subscribed and will see later writes
+        yield b": subscribed\n\n"
+        while True:
+            event = await subscription.get(heartbeat)
+            if event is None:
+                yield b": keep-alive\n\n"
+            else:
+                yield b"event: %s\ndata: %s\n\n" % (
+                    event["type"].encode(),
+                    orjson.dumps(event),
+                )
+
+
+@router.get("/items/stream", response_class=StreamingResponse)
+async def stream_item_events(events: EventBroadcaster = Depends(get_item_events)):
+    """
+    Live item changes as server-sent events.
+
+    Each event is named after its type ("created", "updated", "deleted")
+    and carries `{"type", "ids"}`, with `ids` null for very large batches.
+    A client that falls ITEM_EVENTS_QUEUE_SIZE events behind gets one
+    "resync" event instead and should refetch what it displays.
+    """
+    return StreamingResponse(
+        _event_stream(events, settings.ITEM_EVENTS_HEARTBEAT),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        await websocket.send_text(orjson.dumps(await subscription.get()).decode())
+
+
+@router.websocket("/items/stream/ws")
+async def stream_item_events_ws(
+    websocket: WebSocket, events: EventBroadcaster = Depends(get_item_events)
+):
+    """The events of /items/stream as JSON WebSocket messages."""
+    await websocket.accept()
+    async with events.subscribe() as subscription:
+        sender = asyncio.create_task(_send_events(websocket, subscription))
+        try:
+            # Messages from the client are ignored; receiving spots the close
+            with contextlib.suppress(WebSocketDisconnect):
+                while True:
+                    await websocket.receive_text()
+        finally:
+            sender.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sender
+
+
+@router.get("/items/search", response_model=list[ItemResponse])
+async def search_items(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    active_only: bool = Query(True, description="Return only active items"),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from the previous page's X-Next-Cursor"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Search items by title and description, best match first.
+
+    Full pages carry an `X-Next-Cursor` header; pass it back as `cursor` to
+    fetch the next page.
+    """
+    service = ItemService(db)
+    try:
+        items, next_cursor = await service.search_items(
+            q, limit=limit, active_only=active_only, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
 @router.get("/items", response_model=list[ItemResponse])
 async def get_items(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
     active_only: bool = Query(True, description="Return only active items"),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from the previous page's X-Next-Cursor"
+    ),
+    filters: ItemFilter = Depends(item_filter_query),
+    sort: ItemSort = Query(
+        DEFAULT_SORT, description="Sort key; prefix with '-' for descending"
+    ),
+    fields: list[str] | None = Depends(fields_query),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get all items with pagination."""
+    """
+    Get all items with pagination, filtering and sorting.
+
+    Range filters (`title_prefix`, `created_*`, `updated_*`) must be on the
+    sort column so an index can serve the query; other combinations are
+    rejected with 400. `is_active`, when given, overrides `active_only`.
+    `fields` limits both the columns read and the keys returned.
+
+    Full pages carry an `X-Next-Cursor` header; pass it back as `cursor` to
+    fetch the next page by keyset instead of `skip`.
+
+    The weak ETag is a hash of the page itself, so polling clients get 304
+    until the page changes, deletes included. Lists carry no Last-Modified:
+    no timestamp advances when an item is deleted.
+    """
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor")
+
     service = ItemService(db)
-    return await service.get_items(skip=skip, limit=limit, active_only=active_only)
+    try:
+        items, next_cursor = await service.get_items(
+            skip=skip,
+            limit=limit,
+            active_only=active_only,
+            cursor=cursor,
+            filters=filters,
+            sort=sort,
+            fields=fields,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # Rows are already shaped like ItemResponse; returning the response
+    # directly skips a second validation pass over every item
+    response = ORJSONResponse(items)
+    headers = validator_headers(
+        content_etag(response.body, (next_cursor or "").encode()), None
+    )
+    if is_not_modified(request, headers["etag"], None):
+        return not_modified(headers)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    response.headers.update(headers)
+    return response
 
 
 @router.get("/items/{item_id}", response_model=ItemResponse)
-async def get_item(item_id: int, db: AsyncSession = Depends(get_db)):
-    """Get a specific item by ID."""
+async def get_item(
+    item_id: int,
+    request: Request,
+    response: Response,
+    fields: list[str] | None = Depends(fields_query),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get a specific item by ID, optionally only some of its fields.
+
+    Requests with If-None-Match or If-Modified-Since are first checked
+    against the item's version alone and answered with 304 if current.
+    The ETag carries the version for use in If-Match on updates.
+    """
     service = ItemService(db)
+    if has_validators(request):
+        current = await service.get_item_version(item_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        version, updated_at = current
+        headers = validator_headers(
+            _item_etag(item_id, version, fields), updated_at
+        )
+        if is_not_modified(request, headers["etag"], updated_at):
+            return not_modified(headers)
+
+    if fields:
+        item = await service.get_item_fields(
+            item_id, [*fields, "version", "updated_at"]
+        )
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        headers = validator_headers(
+            _item_etag(item_id, item["version"], fields), item["updated_at"]
+        )
+        for name in ("version", "updated_at"):
+            if name not in fields:
+                del item[name]
+        return ORJSONResponse(item, headers=headers)
+
     item = await service.get_item(item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
+    response.headers.update(
+        validator_headers(_item_etag(item.id, item.version), item.updated_at)
+    )
     return item
 
 
 @router.put("/items/{item_id}", response_model=ItemResponse)
 async def update_item(
-    item_id: int, item_data: ItemUpdate, db: AsyncSession = Depends(get_db)
+    item_id: int,
+    item_data: ItemUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
 ):
-    """Update an existing item."""
+    """
+    Update an existing item.
+
+    Send the item's ETag in `If-Match` to update only if nobody else has
+    changed it since; a stale ETag gets 412 and nothing is written.
+    """
+    expected_version = None
+    if_match = request.headers.get("if-match")
+    if if_match is not None and if_match.strip() != "*":
+        expected_version = _etag_version(if_match, item_id)
+        if expected_version is None:
+            raise HTTPException(status_code=412, detail="Precondition failed")
+
     service = ItemService(db)
-    item = await service.update_item(item_id, item_data)
+    try:
+        item = await service.update_item(item_id, item_data, expected_version)
+    except VersionConflict as e:
+        raise HTTPException(
+            status_code=412, detail="Item was modified by someone else"
+        ) from e
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
+    response.headers["etag"] = _item_etag(item.id, item.version)
     return item
 
 
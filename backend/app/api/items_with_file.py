@@ -1,18 +1,62 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.file_response import storage_file_response
+from app.core.metrics import UPLOAD_BYTES, UPLOAD_FILES
+from app.core.storage import get_storage
+from app.schemas.item import ItemResponse
 from app.schemas.item_with_file import (
+    ItemFileBase,
     ItemFileErrorResponse,
+    ItemFileRead,
     ItemFileResponse,
     create_item_form,
     validate_file,
 )
+from app.services.file_blob import FileBlobService
 from app.services.item import ItemService
-
-router = APIRouter(prefix="/api/items", tags=["items-with-file"])
+from app.storage import StorageBackend
+
+router = APIRouter(prefix="/items", tags=["items-with-file"])
+
+
+async def _create_item(
+    db: AsyncSession, storage: StorageBackend, item_data: dict, files: list[UploadFile]
+) -> tuple[ItemResponse, list[ItemFileRead]]:
+    """파일을 내용 해시 기준으로 저장(중복 제거)한 뒤 항목을 생성합니다."""
+    file_metadata = await FileBlobService(db, storage).store_uploads(files)
+    item, item_files = await ItemService(db).create_item_with_files(
+        item_data, file_metadata
+    )
+    UPLOAD_FILES.inc(len(item_files))
+    UPLOAD_BYTES.inc(sum(item_file.size for item_file in item_files))
+    return item, item_files
+
+
+def _file_response(item: ItemResponse, item_file: ItemFileRead) -> ItemFileResponse:
+    return ItemFileResponse(
+        id=item.id,
+        title=item.title,
+        description=item.description,
+        is_active=item.is_active,
+        created_at=item.created_at,
+        updated_at=item.updated_at,
+        file_url=item_file.file_url,
+        file_size=item_file.size,
+        file_type=item_file.content_type,
+    )
 
 
 @router.post("/with-file", response_model=ItemFileResponse, responses={
@@ -24,7 +68,8 @@ async def create_item_with_file(
     description: Optional[str] = Form(None, max_length=1000),
     is_active: bool = Form(True),
     file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    storage: StorageBackend = Depends(get_storage),
 ):
     """
     파일을 포함한 항목 생성 (FormData)
@@ -37,39 +82,19 @@ async def create_item_with_file(
     try:
         # 서버 측 검증
         validated_file = validate_file(file)
-        validated_item = create_item_form(
+        validated_item, _ = create_item_form(
             title=title,
             description=description,
             is_active=is_active,
             file=validated_file
         )
 
-        # 파일 저장 로직 (여기서는 실제 저장 대신 메타데이터만 저장)
-        file_metadata = {
-            'filename': validated_file.filename,
-            'content_type': validated_file.content_type,
-            'size': validated_file.size,
-            'file_url': f"/uploads/{validated_file.filename}"  # 실제 구현 시에 저장된 파일 URL
-        }
-
-        # 항목 생성 서비스 호출
-        item_service = ItemService(db)
-        item = await item_service.create_item(
-            item_data=validated_item.dict(),
-            file_metadata=file_metadata
+        # 항목 생성 서비스 호출 (파일은 청크 단위로 스트리밍 저장)
+        item, item_files = await _create_item(
+            db, storage, validated_item.model_dump(), [validated_file]
         )
 
-        return ItemFileResponse(
-            id=item.id,
-            title=item.title,
-            description=item.description,
-            is_active=item.is_active,
-            created_at=item.created_at,
-            updated_at=item.updated_at,
-            file_url=file_metadata['file_url'],
-            file_size=file_metadata['size'],
-            file_type=file_metadata['content_type']
-        )
+        return _file_response(item, item_files[0])
 
     except ValueError as e:
         # 클라이언트에서 재사용할 수 있는 에러 형식
@@ -80,7 +105,9 @@ async def create_item_with_file(
                 "message": str(e)
             }
         ])
-        raise HTTPException(status_code=422, detail=error_response.detail)
+        raise HTTPException(
+            status_code=422, detail=error_response.model_dump()["detail"]
+        )
 
     except Exception:
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
@@ -95,7 +122,8 @@ async def create_item_with_multiple_files(
     description: Optional[str] = Form(None, max_length=1000),
     is_active: bool = Form(True),
     files: list[UploadFile] = File(...),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    storage: StorageBackend = Depends(get_storage),
 ):
     """
     여러 파일을 포함한 항목 생성 (FormData)
@@ -109,43 +137,20 @@ async def create_item_with_multiple_files(
         if len(files) > 5:
             raise ValueError("최대 5개의 파일만 업로드할 수 있습니다")
 
-        file_urls = []
+        validated_item = ItemFileBase(
+            title=title, description=description, is_active=is_active
+        )
 
         # 각 파일 검증
-        for file in files:
-            validated_file = validate_file(file)
-
-            file_metadata = {
-                'filename': validated_file.filename,
-                'content_type': validated_file.content_type,
-                'size': validated_file.size,
-                'file_url': f"/uploads/{validated_file.filename}"
-            }
-            file_urls.append(file_metadata)
+        validated_files = [validate_file(file) for file in files]
 
         # 항목 생성 (여러 파일일 경우 하나의 항목에 파일 목록 저장)
-        item_service = ItemService(db)
-        item = await item_service.create_item(
-            item_data={
-                'title': title,
-                'description': description,
-                'is_active': is_active
-            },
-            file_metadata={'files': file_urls}
+        item, item_files = await _create_item(
+            db, storage, validated_item.model_dump(), validated_files
         )
 
-        # 응답 생성
-        return [ItemFileResponse(
-            id=item.id,
-            title=item.title,
-            description=item.description,
-            is_active=item.is_active,
-            created_at=item.created_at,
-            updated_at=item.updated_at,
-            file_url=file_urls[0]['file_url'] if file_urls else None,
-            file_size=file_urls[0]['size'] if file_urls else None,
-            file_type=file_urls[0]['content_type'] if file_urls else None
-        )]
+        # 응답 생성 (파일마다 하나씩)
+        return [_file_response(item, item_file) for item_file in item_files]
 
     except ValueError as e:
         error_response = ItemFileErrorResponse(detail=[
@@ -155,7 +160,48 @@ async def create_item_with_multiple_files(
                 "message": str(e)
             }
         ])
-        raise HTTPException(status_code=422, detail=error_response.detail)
+        raise HTTPException(
+            status_code=422, detail=error_response.model_dump()["detail"]
+        )
 
     except Exception:
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다")
+
+
+@router.api_route(
+    "/{item_id}/files/{file_id}",
+    methods=["GET", "HEAD"],
+    response_class=Response,
+    responses={
+        206: {"description": "Partial Content"},
+        304: {"description": "Not Modified"},
+        404: {"description": "Not Found"},
+        416: {"description": "Range Not Satisfiable"},
+    },
+)
+async def download_item_file(
+    item_id: int,
+    file_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    storage: StorageBackend = Depends(get_storage),
+):
+    """
+    항목에 첨부된 파일 다운로드
+
+    - `Range` 요청으로 이어받기/탐색 지원 (206)
+    - 내용 해시 기반 `ETag`, `If-None-Match` 일치 시 304
+    """
+    item_file = await ItemService(db).get_item_file(item_id, file_id)
+    if not item_file:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    return storage_file_response(
+        request,
+        storage,
+        key=item_file.storage_key,
+        size=item_file.size,
+        etag=f'"{item_file.sha256}"',
+        media_type=item_file.content_type,
+        filename=item_file.filename,
+    )
@@ -0,0 +1,15 @@
+"""
+Prometheus metrics endpoint.
+"""
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=Response)
+async def prometheus_metrics():
+    """Metrics in the Prometheus text exposition format, for every worker."""
+    body, content_type = render()
+    return Response(body, media_type=content_type)
@@ -0,0 +1,192 @@
+"""
+Caching utilities: a small in-process TTL cache and async cache backends.
+"""
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import settings
+from app.core.metrics import CACHE_LOOKUPS
+
+
+class TTLCache:
+    """Minimal in-process cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for `ttl` seconds. A non-positive ttl disables caching."""
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+class CacheBackend(ABC):
+    """
+    Async key/value cache shared by service-layer read-through caching.
+
+    Values are bytes with a per-entry TTL. Counters are kept apart from
+    regular entries and never expire, so they can version groups of keys.
+    Hits and misses of `get` are counted for metrics.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value, counting the lookup as a hit or miss."""
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+            CACHE_LOOKUPS.labels("miss").inc()
+        else:
+            self.hits += 1
+            CACHE_LOOKUPS.labels("hit").inc()
+        return value
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters since startup."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    @abstractmethod
+    async def _get(self, key: str) -> bytes | None:
+        """Return the cached value, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Cache a value for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Drop the given keys."""
+
+    @abstractmethod
+    async def counter(self, key: str) -> int:
+        """Current value of a counter (0 if never incremented)."""
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Increment a counter and return its new value."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry and counter."""
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+
+    async def _get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._counters.clear()
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache backed by any Redis-protocol server.
+
+    Requires the optional `redis` dependency unless a client is passed in.
+    """
+
+    def __init__(self, url: str = "", client: Any = None, prefix: str = "cache:"):
+        super().__init__()
+        if client is None:
+            try:
+                from redis.asyncio import Redis
+            except ImportError as e:  # pragma: no cover - depends on environment
+                raise RuntimeError("Redis caching requires the 'redis' package") from e
+            client = Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    async def _get(self, key: str) -> bytes | None:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def counter(self, key: str) -> int:
+        return int(await self.client.get(self.prefix + key) or 0)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(self.prefix + key)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+        if keys:
+            await self.client.delete(*keys)
+
+
+@lru_cache
+def get_item_cache() -> CacheBackend:
+    """
+    Item cache selected by ITEM_CACHE_BACKEND ("memory" or "redis").
+
+    "memory" is per process, so only suits a single worker.
+    """
+    if settings.ITEM_CACHE_BACKEND == "redis":
+        return RedisCache(settings.REDIS_URL, prefix="items:")
+    return MemoryCache(max_entries=settings.ITEM_CACHE_MAX_ENTRIES)
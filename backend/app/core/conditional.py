@@ -0,0 +1,72 @@
+"""
+Conditional request helpers: ETag and Last-Modified validators.
+"""
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` by weak comparison."""
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive timestamps; they are UTC like PostgreSQL's
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def content_etag(*chunks: bytes) -> str:
+    """Weak ETag hashed from the representation itself."""
+    digest = hashlib.sha1()
+    for chunk in chunks:
+        digest.update(chunk)
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """ETag, Last-Modified and a Cache-Control asking clients to revalidate."""
+    headers = {"etag": etag, "cache-control": "private, no-cache"}
+    if last_modified is not None:
+        headers["last-modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> bool:
+    """
+    Whether the client's cached copy is current.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    without it, at the header's one-second resolution.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def has_validators(request: Request) -> bool:
+    """Whether the request carries any cache validator."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """Empty 304 response carrying the current validators."""
+    return Response(status_code=304, headers=headers)
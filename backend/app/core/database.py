@@ -1,12 +1,31 @@
 """
 Database configuration and session management.
 """
+import logging
+import time
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_DURATION,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUTS,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -15,15 +34,126 @@ class Base(DeclarativeBase):
     pass
 
 
+class PoolStats:
+    """Checkout latency and exhaustion counters for one connection pool."""
+
+    def __init__(self, name: str = "primary"):
+        self.name = name
+        self.checkouts = 0
+        self.checkout_seconds = 0.0
+        self.max_checkout_seconds = 0.0
+        self.timeouts = 0
+
+    def record(self, seconds: float) -> None:
+        """Record one checkout that took `seconds` to get a connection."""
+        self.checkouts += 1
+        self.checkout_seconds += seconds
+        self.max_checkout_seconds = max(self.max_checkout_seconds, seconds)
+        DB_POOL_CHECKOUT_DURATION.labels(self.name).observe(seconds)
+
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that times every checkout.
+
+    The time covers waiting for a free connection, opening a new one and
+    the pre-ping, i.e. everything a request waits on before its first
+    query. Stats survive `dispose()`, which replaces the pool. Checkouts
+    and occupancy are also exported as Prometheus metrics labelled with
+    the pool's name.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            DB_POOL_TIMEOUTS.labels(self.stats.name).inc()
+            logger.warning("Connection pool exhausted: %s", self.status())
+            raise
+        finally:
+            self.stats.record(time.perf_counter() - start)
+            DB_POOL_CHECKED_OUT.labels(self.stats.name).set(self.checkedout())
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        DB_POOL_CHECKED_OUT.labels(self.stats.name).set(self.checkedout())
+
+    def recreate(self) -> "MeteredPool":
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def pool_metrics(engine: AsyncEngine) -> dict[str, float]:
+    """Current pool occupancy and checkout latency of an engine."""
+    pool = engine.pool
+    metrics = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        metrics.update(
+            checkouts=stats.checkouts,
+            checkout_timeouts=stats.timeouts,
+            checkout_seconds_total=stats.checkout_seconds,
+            checkout_seconds_max=stats.max_checkout_seconds,
+        )
+    return metrics
+
+
+def create_engine(url: str, name: str = "primary") -> AsyncEngine:
+    """
+    Create an async engine configured from the DB_* settings.
+
+    `name` labels the engine's pool in metrics.
+
+    With DB_PGBOUNCER, asyncpg's statement caches are turned off and every
+    prepared statement gets a unique name, since pgbouncer in transaction
+    mode may run consecutive statements on different server connections.
+    """
+    url = url.replace("postgresql://", "postgresql+asyncpg://")
+    connect_args = {}
+    if url.startswith("postgresql+asyncpg://"):
+        cache_size = 0 if settings.DB_PGBOUNCER else settings.DB_STATEMENT_CACHE_SIZE
+        # asyncpg's own cache, and SQLAlchemy's cache of prepared statements
+        connect_args["statement_cache_size"] = cache_size
+        connect_args["prepared_statement_cache_size"] = cache_size
+        if settings.DB_PGBOUNCER:
+            connect_args["prepared_statement_name_func"] = (
+                lambda: f"__asyncpg_{uuid4()}__"
+            )
+
+    engine = create_async_engine(
+        url,
+        poolclass=MeteredPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        connect_args=connect_args,
+        echo=settings.DB_ECHO,
+        # Explicitly enable asyncio mode
+        future=True,
+    )
+    engine.pool.stats.name = name
+    DB_POOL_SIZE.labels(name).set(engine.pool.size())
+    return engine
+
+
 # Create async engine with explicit greenlet support
-async_engine = create_async_engine(
-    settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    echo=settings.DEBUG,
-    # Explicitly enable asyncio mode
-    future=True,
-)
+async_engine = create_engine(settings.DATABASE_URL)
 
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -33,18 +163,41 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Read-only work needs no transaction: skipping BEGIN/ROLLBACK saves two
+# round trips per request
+AutocommitSessionLocal = async_sessionmaker(
+    async_engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
 
+    The session checks out a connection only when its first statement
+    runs, so requests that never query cost no pool checkout.
+
     Yields:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def get_autocommit_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a database session for read-only work.
+
+    Every statement commits on its own, so nothing it writes can be rolled
+    back and server-side cursors (`stream()`) are unavailable.
+
+    Yields:
+        AsyncSession: Autocommit database session
+    """
+    async with AutocommitSessionLocal() as session:
+        yield session
 
 
 async def init_db() -> None:
@@ -0,0 +1,198 @@
+"""
+Item change events fanned out to /api/items/stream subscribers.
+"""
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+import asyncpg
+import orjson
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel item writes send to when ITEM_EVENTS_BACKEND is "postgres"
+CHANNEL = "item_changes"
+
+# Events naming more items than this carry `ids: null`; the same limit
+# keeps NOTIFY payloads under PostgreSQL's 8000 byte cap
+MAX_EVENT_IDS = 500
+
+RESYNC = {"type": "resync", "ids": None}
+
+
+def item_event(event_type: str, item_ids: tuple[int, ...]) -> dict[str, Any]:
+    """An event as subscribers receive it: its type and the affected IDs."""
+    ids = list(item_ids) if len(item_ids) <= MAX_EVENT_IDS else None
+    return {"type": event_type, "ids": ids}
+
+
+def notify_payload(event_type: str, item_ids: tuple[int, ...]) -> str:
+    """`item_event` encoded as the NOTIFY payload PostgresBroadcaster receives."""
+    return orjson.dumps(item_event(event_type, item_ids)).decode()
+
+
+class Subscription:
+    """
+    One subscriber's bounded queue of events.
+
+    Publishing never waits on a subscriber. Once `max_queue` events are
+    pending, the backlog is dropped and replaced by a single RESYNC event,
+    telling the client to refetch what it shows rather than replay changes.
+    """
+
+    def __init__(self, max_queue: int):
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(max_queue)
+        self.resyncs = 0
+
+    def put(self, event: dict[str, Any]) -> None:
+        """Queue `event`, or collapse the backlog into a resync when full."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+            self.resyncs += 1
+
+    async def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """The next event, or None if none arrived within `timeout` seconds."""
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.queue.get()
+        except TimeoutError:
+            return None
+
+
+class EventBroadcaster:
+    """
+    In-process fan-out of item events to every subscription.
+
+    Sees only what this process publishes, which suffices for a single
+    worker and for tests; PostgresBroadcaster covers several workers.
+    """
+
+    # NOTIFY channel writers send events to within their transaction, if any
+    notify_channel: str | None = None
+
+    def __init__(self, max_queue: int = settings.ITEM_EVENTS_QUEUE_SIZE):
+        self.max_queue = max_queue
+        self._subscriptions: set[Subscription] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[Subscription]:
+        """Receive events published until the block exits."""
+        subscription = Subscription(self.max_queue)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event_type: str, *item_ids: int) -> None:
+        """Announce a committed change to `item_ids`."""
+        self.dispatch(item_event(event_type, item_ids))
+
+    def dispatch(self, event: dict[str, Any]) -> None:
+        """Hand `event` to every subscription of this process."""
+        for subscription in list(self._subscriptions):
+            subscription.put(event)
+
+    async def start(self) -> None:
+        """Start receiving events from outside the process, if any."""
+
+    async def stop(self) -> None:
+        """Stop receiving events from outside the process."""
+
+
+class PostgresBroadcaster(EventBroadcaster):
+    """
+    Fans out NOTIFYs from item writes over one LISTEN connection.
+
+    ItemRepository sends one NOTIFY per write or bulk chunk inside its
+    transaction, so every worker hears of it on commit and `publish`
+    does nothing here. The connection lives outside the pool and is
+    re-established when lost; subscribers then get a RESYNC event since
+    notifications sent meanwhile are gone.
+    """
+
+    notify_channel = CHANNEL
+
+    def __init__(
+        self,
+        url: str,
+        max_queue: int = settings.ITEM_EVENTS_QUEUE_SIZE,
+        reconnect_interval: float = 1.0,
+    ):
+        super().__init__(max_queue)
+        # asyncpg takes plain libpq URLs
+        self.url = make_url(url).set(drivername="postgresql")
+        self.reconnect_interval = reconnect_interval
+        self._task: asyncio.Task | None = None
+
+    def publish(self, event_type: str, *item_ids: int) -> None:
+        """No-op: the write's NOTIFY reaches every worker, this one included."""
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _listen(self) -> None:
+        connected_before = False
+        while True:
+            try:
+                conn = await asyncpg.connect(
+                    self.url.render_as_string(hide_password=False)
+                )
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Item events: cannot connect for LISTEN: %s", e)
+                await asyncio.sleep(self.reconnect_interval)
+                continue
+            lost = asyncio.get_running_loop().create_future()
+            conn.add_termination_listener(
+                lambda _conn, lost=lost: lost.done() or lost.set_result(None)
+            )
+            try:
+                await conn.add_listener(CHANNEL, self._notify)
+                if connected_before:
+                    self.dispatch(RESYNC)
+                connected_before = True
+                await lost
+                logger.warning("Item events: LISTEN connection lost, reconnecting")
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Item events: LISTEN failed: %s", e)
+            finally:
+                conn.terminate()
+            await asyncio.sleep(self.reconnect_interval)
+
+    def _notify(self, conn, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning("Item events: ignoring malformed payload %r", payload)
+            return
+        self.dispatch(event)
+
+
+@lru_cache
+def get_item_events() -> EventBroadcaster:
+    """Item event broadcaster selected by ITEM_EVENTS_BACKEND."""
+    if settings.ITEM_EVENTS_BACKEND == "postgres":
+        return PostgresBroadcaster(settings.DATABASE_URL)
+    return EventBroadcaster()
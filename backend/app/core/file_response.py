@@ -0,0 +1,169 @@
+"""
+Conditional and ranged file responses served from storage backends.
+"""
+
+import re
+from urllib.parse import quote
+
+from fastapi import Request, Response
+from starlette.types import Receive, Scope, Send
+
+from app.core.conditional import etag_matches
+from app.storage import LocalStorage, StorageBackend
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested byte range lies outside the file."""
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range `Range` header into a `[start, end)` pair.
+
+    Returns None when the whole file should be sent: no header, a syntax we
+    don't serve (e.g. multiple ranges), which RFC 9110 lets us ignore.
+
+    Raises:
+        RangeNotSatisfiable: If the range starts beyond the end of the file.
+    """
+    match = _RANGE_PATTERN.fullmatch(header.strip()) if header else None
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the final `last` bytes
+        suffix = int(last)
+        if suffix == 0:
+            raise RangeNotSatisfiable
+        return max(size - suffix, 0), size
+
+    start = int(first)
+    end = min(int(last) + 1, size) if last else size
+    if start >= size or start >= end:
+        raise RangeNotSatisfiable
+    return start, end
+
+
+def _content_disposition(filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"inline; filename*=utf-8''{quoted}"
+    return f'inline; filename="{filename}"'
+
+
+class StorageFileResponse(Response):
+    """
+    Streams `[start, end)` of a stored object.
+
+    Local files are handed to the server with the ASGI zero-copy send
+    extension when it is available; everything else is read in chunks.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        key: str,
+        start: int,
+        end: int,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        method: str = "GET",
+    ):
+        self.storage = storage
+        self.key = key
+        self.start = start
+        self.end = end
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.send_header_only = method.upper() == "HEAD"
+        self.init_headers(headers)
+        self.headers["content-length"] = str(end - start)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if self.send_header_only or self.end <= self.start:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if isinstance(self.storage, LocalStorage) and (
+            "http.response.zerocopysend" in extensions
+        ):
+            with open(self.storage.path(self.key), "rb") as file:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": file,
+                        "offset": self.start,
+                        "count": self.end - self.start,
+                    }
+                )
+            return
+
+        async for chunk in self.storage.read(self.key, self.start, self.end):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def storage_file_response(
+    request: Request,
+    storage: StorageBackend,
+    key: str,
+    size: int,
+    etag: str,
+    media_type: str,
+    filename: str,
+) -> Response:
+    """
+    Answer a download request for a stored object.
+
+    Honors `If-None-Match` (304), `Range` with `If-Range` (206/416) and
+    HEAD. `etag` must be a strong validator of the content.
+    """
+    headers = {
+        "etag": etag,
+        "accept-ranges": "bytes",
+        "cache-control": "private, no-cache",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            headers["content-range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+    headers["content-disposition"] = _content_disposition(filename)
+
+    status_code = 200
+    start, end = 0, size
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = 206
+        headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+
+    return StorageFileResponse(
+        storage,
+        key,
+        start,
+        end,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+        method=request.method,
+    )
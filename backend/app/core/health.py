@@ -0,0 +1,123 @@
+"""
+Background database health prober behind the liveness and readiness checks.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.database import async_engine, pool_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HealthState:
+    """Outcome of the latest probe."""
+
+    database: bool = False
+    latency_seconds: float | None = None
+    pool_wait_seconds: float = 0.0
+    pool_timeouts: int = 0
+    pool_saturation: float = 0.0
+    error: str | None = "not probed yet"
+    checked_at: float | None = None
+
+
+class HealthProber:
+    """
+    Probes the database every `interval` seconds and keeps the result.
+
+    Health endpoints read `state` instead of querying, so probes cost one
+    pooled checkout per interval per process however often they are
+    polled. `pool_wait_seconds` is the mean checkout wait of all requests
+    since the previous probe, and readiness fails once it passes
+    `max_pool_wait` or a checkout timed out.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        interval: float = settings.HEALTH_PROBE_INTERVAL,
+        timeout: float = settings.HEALTH_PROBE_TIMEOUT,
+        max_pool_wait: float = settings.HEALTH_MAX_POOL_WAIT,
+    ):
+        self.engine = engine
+        self.interval = interval
+        self.timeout = timeout
+        self.max_pool_wait = max_pool_wait
+        self.state = HealthState()
+        self._last_stats = (0, 0.0, 0)
+
+    def is_ready(self) -> bool:
+        """Whether a recent probe found the database usable without long waits."""
+        state = self.state
+        return (
+            state.database
+            and state.checked_at is not None
+            and time.monotonic() - state.checked_at <= 3 * self.interval
+            and state.pool_wait_seconds <= self.max_pool_wait
+            and not state.pool_timeouts
+        )
+
+    def snapshot(self) -> dict:
+        """The latest state, with its age in seconds instead of a timestamp."""
+        state = asdict(self.state)
+        checked_at = state.pop("checked_at")
+        state["age_seconds"] = (
+            None if checked_at is None else time.monotonic() - checked_at
+        )
+        return state
+
+    async def probe(self) -> HealthState:
+        """Run one probe and store its result."""
+        # Pool waits are measured before our own checkout adds to them
+        pool = self._pool_wait()
+        start = time.perf_counter()
+        database, error = True, None
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            database, error = False, str(e) or type(e).__name__
+            logger.warning("Database health probe failed: %s", error)
+
+        metrics = pool_metrics(self.engine)
+        capacity = metrics["size"] + metrics["max_overflow"]
+        self.state = HealthState(
+            database=database,
+            latency_seconds=time.perf_counter() - start if database else None,
+            pool_wait_seconds=pool[0],
+            pool_timeouts=pool[1],
+            pool_saturation=metrics["checked_out"] / capacity if capacity else 0.0,
+            error=error,
+            checked_at=time.monotonic(),
+        )
+        return self.state
+
+    async def run(self) -> None:
+        """Probe every `interval` seconds until cancelled."""
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    def _pool_wait(self) -> tuple[float, int]:
+        """Mean checkout wait and timeouts since the previous probe."""
+        stats = getattr(self.engine.pool, "stats", None)
+        if stats is None:
+            return 0.0, 0
+        checkouts, seconds, timeouts = self._last_stats
+        self._last_stats = (stats.checkouts, stats.checkout_seconds, stats.timeouts)
+        new_checkouts = stats.checkouts - checkouts
+        if not new_checkouts:
+            return 0.0, stats.timeouts - timeouts
+        wait = (stats.checkout_seconds - seconds) / new_checkouts
+        return wait, stats.timeouts - timeouts
+
+
+health_prober = HealthProber(async_engine)
@@ -0,0 +1,142 @@
+"""
+Per-request SQL statement counts and timings.
+"""
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SQLStats:
+    """Statements run within one request or `capture_sql()` block."""
+
+    statements: int = 0
+    seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> int:
+        """Record one statement; returns how often its shape has now run."""
+        self.statements += 1
+        self.seconds += seconds
+        if seconds >= self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+        self.shapes[statement] += 1
+        return self.shapes[statement]
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value for these statements."""
+        return (
+            f'db;dur={self.seconds * 1000:.1f};desc="{self.statements} statements", '
+            f"db-slowest;dur={self.slowest_seconds * 1000:.1f}"
+        )
+
+    def log_fields(self) -> dict[str, float]:
+        """Structured fields for the request's log record."""
+        return {
+            "db_statements": self.statements,
+            "db_ms": round(self.seconds * 1000, 3),
+            "db_slowest_ms": round(self.slowest_seconds * 1000, 3),
+        }
+
+
+# Every open capture, outermost first; a request nests inside a test's capture
+_active: ContextVar[tuple[SQLStats, ...]] = ContextVar("sql_stats", default=())
+
+
+@contextmanager
+def capture_sql() -> Iterator[SQLStats]:
+    """Record every statement any engine runs in this context until exit."""
+    stats = SQLStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _active.get():
+        context._sql_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record(conn, cursor, statement, parameters, context, executemany):
+    active = _active.get()
+    started = getattr(context, "_sql_started", None)
+    if not active or started is None:
+        return
+    seconds = time.perf_counter() - started
+    for stats in active:
+        repeats = stats.record(statement, seconds)
+    # Parameters are bound, so the same text in a loop is the same query
+    if settings.DEBUG and repeats == settings.SQL_REPEAT_WARN_THRESHOLD:
+        logger.warning(
+            "Same statement ran %d times in one request (N+1 query?): %s",
+            repeats,
+            statement,
+        )
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Count and time the SQL each request runs.
+
+    The totals and the slowest statement go out in a `Server-Timing`
+    header, sent before any streamed body so it covers the work up to the
+    first byte, and into a log record once the response is finished.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        with capture_sql() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", stats.server_timing().encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                logger.info(
+                    "%s %s %d: %d statements in %.1f ms",
+                    scope["method"],
+                    scope["path"],
+                    status,
+                    stats.statements,
+                    stats.seconds * 1000,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        **stats.log_fields(),
+                    },
+                )
@@ -0,0 +1,61 @@
+"""
+Opaque cursor helpers for keyset pagination.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+
+def _encode(position: list[Any]) -> str:
+    payload = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list[Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(sort: str, value: datetime | str | int, item_id: int) -> str:
+    """Encode a `(value, id)` keyset position in a list ordered by `sort`."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return _encode([sort, value, item_id])
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[str | int, int]:
+    """
+    Decode an opaque cursor back into its `(value, id)` position.
+
+    Datetime values come back as ISO 8601 strings.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort.
+    """
+    try:
+        cursor_sort, value, item_id = _decode(cursor)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_sort != sort or not isinstance(value, str | int):
+        raise ValueError("Invalid cursor")
+    return value, int(item_id)
+
+
+def encode_rank_cursor(rank: float, item_id: int) -> str:
+    """Encode a `(rank, id)` position in ranked search results."""
+    return _encode([rank, item_id])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Decode a ranked search cursor back into its `(rank, id)` position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        rank, item_id = _decode(cursor)
+        return float(rank), int(item_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,187 @@
+"""
+Read replica routing for read-only endpoints.
+"""
+import logging
+import math
+import time
+from collections.abc import AsyncGenerator
+
+from fastapi import Depends, Request
+from sqlalchemy import exc, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import create_engine, get_autocommit_db
+
+logger = logging.getLogger(__name__)
+
+# Holds the time until which a client that just wrote reads from the primary
+PRIMARY_COOKIE = "db_primary_until"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Seconds since the last replayed transaction, or 0 when the replica has
+# replayed everything it received (an idle primary is not lag)
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery()
+            OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class Replica:
+    """A read replica's engine, session factory and last measured lag."""
+
+    def __init__(self, url: str):
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.engine = create_engine(url, name=self.name)
+        self.sessionmaker = async_sessionmaker(
+            self.engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            info={"replica": self.name},
+        )
+        self.lag: float | None = None
+        self.checked_at = -math.inf
+
+    async def measure_lag(self) -> float:
+        """Current replay lag in seconds; databases without replication have none."""
+        if self.engine.dialect.name != "postgresql":
+            return 0.0
+        async with self.engine.connect() as conn:
+            return float(await conn.scalar(REPLICA_LAG_QUERY))
+
+
+class ReplicaSet:
+    """
+    Round-robin over read replicas, skipping any that lag too far behind.
+
+    Each replica's lag is measured at most every `check_interval` seconds;
+    one that lags more than `max_lag` seconds, or cannot be reached, is
+    passed over until a later check finds it caught up.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_lag: float = settings.DB_REPLICA_MAX_LAG,
+        check_interval: float = settings.DB_REPLICA_LAG_CHECK_INTERVAL,
+    ):
+        self.replicas = [Replica(url) for url in urls]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    async def choose(self) -> Replica | None:
+        """The next replica within the lag limit, or None to use the primary."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            lag = await self._lag(replica)
+            if lag is not None and lag <= self.max_lag:
+                return replica
+        return None
+
+    async def dispose(self) -> None:
+        """Close every replica's connections."""
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _lag(self, replica: Replica) -> float | None:
+        now = time.monotonic()
+        if now - replica.checked_at < self.check_interval:
+            return replica.lag
+        # Claim the check first so concurrent requests don't all run it
+        replica.checked_at = now
+        try:
+            replica.lag = await replica.measure_lag()
+        except (exc.SQLAlchemyError, OSError) as e:
+            logger.warning("Read replica %s unavailable: %s", replica.name, e)
+            replica.lag = math.inf
+        if replica.lag > self.max_lag:
+            logger.warning("Read replica %s lags %.1fs", replica.name, replica.lag)
+        return replica.lag
+
+
+read_replicas = ReplicaSet(settings.DATABASE_REPLICA_URLS)
+
+
+def _reads_primary(request: Request) -> bool:
+    """Whether the client wrote recently enough to need the primary."""
+    try:
+        until = float(request.cookies.get(PRIMARY_COOKIE, 0))
+    except ValueError:
+        return False
+    return until > time.time()
+
+
+async def get_read_db(
+    request: Request, db: AsyncSession = Depends(get_autocommit_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an autocommit session for read-only work.
+
+    Uses a read replica when one is configured and within the lag limit,
+    otherwise the primary session from `get_autocommit_db`, which connects
+    lazily and so costs nothing when unused. Clients that wrote within the
+    last DB_REPLICA_STICKY_SECONDS always read from the primary.
+
+    Yields:
+        AsyncSession: Database session, possibly on a replica
+    """
+    replica = None
+    if len(read_replicas) and not _reads_primary(request):
+        replica = await read_replicas.choose()
+    if replica is None:
+        yield db
+        return
+    async with replica.sessionmaker() as session:
+        yield session
+
+
+class PrimaryStickinessMiddleware:
+    """
+    Pin a client's reads to the primary for a while after each write.
+
+    Successful requests with an unsafe method get a cookie naming when the
+    pin expires, which `get_read_db` honours, so clients read their own
+    writes even while replicas are catching up. Does nothing without
+    replicas.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or not len(read_replicas)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                seconds = settings.DB_REPLICA_STICKY_SECONDS
+                cookie = (
+                    f"{PRIMARY_COOKIE}={time.time() + seconds:.3f}; "
+                    f"Max-Age={math.ceil(seconds)}; Path=/; HttpOnly; SameSite=lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode("latin-1")),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
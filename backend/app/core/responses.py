@@ -0,0 +1,22 @@
+"""
+JSON response class encoded with orjson.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    Datetimes are written the way pydantic writes them (UTC as "Z"), so
+    endpoints that return plain dicts produce the same output as those
+    going through a response model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        )
@@ -0,0 +1,162 @@
+"""
+In-memory cache for the built frontend's static files.
+"""
+import asyncio
+import gzip
+import hashlib
+import logging
+import mimetypes
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Vite fingerprints everything it writes to assets/, so those never change
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+    "image/x-icon",
+}
+
+
+@dataclass
+class StaticAsset:
+    """A static file held in memory with its precompressed variants."""
+
+    content: bytes
+    media_type: str
+    etag: str
+    cache_control: str
+    encodings: dict[str, bytes] = field(default_factory=dict)
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    """Content codings the client accepts, ignoring those with q=0."""
+    accepted = set()
+    for part in (header or "").split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class StaticAssets:
+    """
+    Serves a directory of small static files from memory.
+
+    Files up to `max_size` bytes are read once by `load()` together with
+    brotli (if installed) and gzip variants; larger files fall back to
+    `FileResponse`. Call `load()` again, or run `watch()`, to pick up
+    changes on disk.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._assets: dict[str, StaticAsset] = {}
+        self._mtimes: dict[str, int] = {}
+        self._loaded = False
+
+    def load(self) -> None:
+        """(Re)load every file under the directory."""
+        assets = {}
+        mtimes = self._scan()
+        for name in mtimes:
+            path = self.directory / name
+            if path.stat().st_size <= self.max_size:
+                assets[name] = self._build(name, path.read_bytes())
+        self._assets, self._mtimes, self._loaded = assets, mtimes, True
+        logger.info("Loaded %d static assets from %s", len(assets), self.directory)
+
+    async def watch(self, interval: float = 1.0) -> None:
+        """Reload whenever a file is added, removed or modified."""
+        while True:
+            await asyncio.sleep(interval)
+            if await asyncio.to_thread(self._scan) != self._mtimes:
+                await asyncio.to_thread(self.load)
+
+    def exists(self, name: str) -> bool:
+        """Whether a file is available, in memory or on disk."""
+        if not self._loaded:
+            self.load()
+        return name in self._assets or name in self._mtimes
+
+    def response(self, request: Request, name: str) -> Response | None:
+        """Build a response for `name`, or None if there is no such file."""
+        if not self.exists(name):
+            return None
+
+        asset = self._assets.get(name)
+        if asset is None:
+            return FileResponse(self.directory / name)
+
+        headers = {
+            "etag": asset.etag,
+            "cache-control": asset.cache_control,
+            "vary": "Accept-Encoding",
+        }
+        if request.headers.get("if-none-match") == asset.etag:
+            return Response(status_code=304, headers=headers)
+
+        body = asset.content
+        accepted = _accepted_encodings(request.headers.get("accept-encoding"))
+        for encoding in ("br", "gzip"):
+            if encoding in asset.encodings and encoding in accepted:
+                body = asset.encodings[encoding]
+                headers["content-encoding"] = encoding
+                break
+        return Response(body, media_type=asset.media_type, headers=headers)
+
+    def _scan(self) -> dict[str, int]:
+        if not self.directory.is_dir():
+            return {}
+        return {
+            path.relative_to(self.directory).as_posix(): path.stat().st_mtime_ns
+            for path in self.directory.rglob("*")
+            if path.is_file()
+        }
+
+    def _build(self, name: str, content: bytes) -> StaticAsset:
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        asset = StaticAsset(
+            content=content,
+            media_type=media_type,
+            etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+            cache_control=(
+                IMMUTABLE_CACHE_CONTROL
+                if name.startswith("assets/")
+                else REVALIDATE_CACHE_CONTROL
+            ),
+        )
+        if media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES:
+            variants = {"gzip": gzip.compress(content, 9, mtime=0)}
+            if brotli is not None:
+                variants["br"] = brotli.compress(content, quality=11)
+            asset.encodings = {
+                encoding: data
+                for encoding, data in variants.items()
+                if len(data) < len(content)
+            }
+        return asset
@@ -0,0 +1,26 @@
+"""
+File storage configuration.
+"""
+from functools import lru_cache
+
+from app.core.config import settings
+from app.storage import LocalStorage, S3Storage, StorageBackend
+
+
+@lru_cache
+def get_storage() -> StorageBackend:
+    """
+    Dependency to get the configured storage backend.
+
+    Returns:
+        StorageBackend: Backend selected by STORAGE_BACKEND
+    """
+    if settings.STORAGE_BACKEND == "s3":
+        return S3Storage(
+            bucket=settings.STORAGE_BUCKET_NAME,
+            endpoint_url=settings.STORAGE_ENDPOINT_URL,
+            region=settings.STORAGE_REGION,
+            access_key=settings.STORAGE_ACCESS_KEY,
+            secret_key=settings.STORAGE_SECRET_KEY,
+        )
+    return LocalStorage(settings.STORAGE_LOCAL_ROOT)
@@ -0,0 +1,3 @@
+"""
+Background and scheduled jobs package.
+"""
@@ -0,0 +1,27 @@
+"""
+Garbage-collect file blobs no item references.
+
+Run periodically, e.g. from cron:
+
+    python -m app.jobs.collect_file_blobs
+"""
+import asyncio
+import logging
+
+from app.core.database import AsyncSessionLocal, close_db
+from app.core.storage import get_storage
+from app.services.file_blob import FileBlobService
+
+
+async def main() -> int:
+    """Collect unreferenced blobs and return how many were removed."""
+    try:
+        async with AsyncSessionLocal() as session:
+            return await FileBlobService(session, get_storage()).collect_garbage()
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -1,15 +1,56 @@
 """
 FastAPI application entry point.
 """
+
+import asyncio
+import contextlib
 import os
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
 
-from app.api import health, items, items_with_file
+from app.api import health, items, items_with_file, metrics
 from app.core.config import settings
+from app.core.events import get_item_events
+from app.core.health import health_prober
+from app.core.instrumentation import SQLInstrumentationMiddleware
+from app.core.metrics import MetricsMiddleware, mark_process_dead
+from app.core.replicas import PrimaryStickinessMiddleware, read_replicas
+from app.core.responses import ORJSONResponse
+from app.core.static import StaticAssets
+
+# Built frontend, held in memory (see app/core/static.py)
+static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
+static_assets = StaticAssets(static_dir)
+
+FRONTEND_NOT_BUILT = {
+    "message": "Frontend not built. Run 'make build-frontend' to build the frontend."
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load static assets, start the database health prober and start
+    listening for item events on startup.
+
+    With STATIC_WATCH, static assets are also watched for changes.
+    """
+    static_assets.load()
+    await get_item_events().start()
+    tasks = [asyncio.create_task(health_prober.run())]
+    if settings.STATIC_WATCH:
+        tasks.append(asyncio.create_task(static_assets.watch()))
+    yield
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await get_item_events().stop()
+    await read_replicas.dispose()
+    mark_process_dead()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -18,6 +59,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs" if settings.ENABLE_DOCS else None,
     redoc_url="/redoc" if settings.ENABLE_DOCS else None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -29,58 +72,56 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Read-your-writes for clients whose reads go to replicas
+app.add_middleware(PrimaryStickinessMiddleware)
+
+# Statement counts and DB time per request. It wraps every layer that
+# runs SQL; only MetricsMiddleware, which runs none, sits outside it
+app.add_middleware(SQLInstrumentationMiddleware)
+
+# Request counts and latency per route template. Added last, so it is the
+# outermost layer and its latency covers all the middleware above
+app.add_middleware(MetricsMiddleware)
+
 # API routes
 app.include_router(health.router, prefix="/api", tags=["health"])
+app.include_router(metrics.router, prefix="/api", tags=["metrics"])
 app.include_router(items.router, prefix="/api", tags=["items"])
 app.include_router(items_with_file.router, prefix="/api", tags=["items-with-file"])
 
+
 # Static files
-static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-if os.path.exists(static_dir):
-    # Mount assets directory for JS/CSS files
-    app.mount(
-        "/assets",
-        StaticFiles(directory=os.path.join(static_dir, "assets")),
-        name="assets",
-    )
+@app.get("/assets/{path:path}")
+async def serve_assets(path: str, request: Request):
+    """Serve fingerprinted JS/CSS assets with immutable caching."""
+    response = static_assets.response(request, f"assets/{path}")
+    if response is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return response
 
 
 # Frontend routes
 @app.get("/vite.svg")
-async def serve_vite_svg():
+async def serve_vite_svg(request: Request):
     """Serve vite.svg from static directory."""
-    static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-    vite_svg = os.path.join(static_dir, "vite.svg")
-    if os.path.exists(vite_svg):
-        return FileResponse(vite_svg, media_type="image/svg+xml")
-    return {"error": "File not found"}
+    return static_assets.response(request, "vite.svg") or {"error": "File not found"}
 
 
 @app.get("/favicon.ico")
-async def serve_favicon():
+async def serve_favicon(request: Request):
     """Serve favicon if it exists."""
-    static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-    favicon = os.path.join(static_dir, "favicon.ico")
-    if os.path.exists(favicon):
-        return FileResponse(favicon, media_type="image/x-icon")
-    return {"error": "File not found"}
+    return static_assets.response(request, "favicon.ico") or {"error": "File not found"}
 
 
 @app.get("/")
-async def serve_frontend():
+async def serve_frontend(request: Request):
     """Serve the React frontend."""
-    static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-    index_file = os.path.join(static_dir, "index.html")
-    if os.path.exists(index_file):
-        return FileResponse(index_file, media_type="text/html")
-    return {
-        "message": "Frontend not built. Run 'make build-frontend' to build the frontend."
-    }
+    return static_assets.response(request, "index.html") or FRONTEND_NOT_BUILT
 
 
 # Catch-all route for SPA routing (must be last)
 @app.get("/{path:path}")
-async def serve_spa_routes(path: str):
+async def serve_spa_routes(path: str, request: Request):
     """Serve React frontend for all non-API routes (SPA routing)."""
     # Don't serve frontend for API routes or assets
     if (
@@ -92,10 +133,4 @@ async def serve_spa_routes(path: str):
         return {"error": "Not found"}
 
     # For all other routes, serve the React app (SPA routing)
-    static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-    index_file = os.path.join(static_dir, "index.html")
-    if os.path.exists(index_file):
-        return FileResponse(index_file, media_type="text/html")
-    return {
-        "message": "Frontend not built. Run 'make build-frontend' to build the frontend."
-    }
+    return static_assets.response(request, "index.html") or FRONTEND_NOT_BUILT
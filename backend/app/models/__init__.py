@@ -1,6 +1,8 @@
 """
 Database models package.
 """
+from app.models.file_blob import FileBlob
 from app.models.item import Item
+from app.models.item_file import ItemFile
 
-__all__ = ["Item"]
+__all__ = ["Item", "ItemFile", "FileBlob"]
@@ -0,0 +1,32 @@
+"""
+FileBlob model for content-addressed upload storage.
+"""
+from sqlalchemy import BigInteger, Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class FileBlob(Base):
+    """
+    A stored object, keyed by the SHA-256 of its content.
+
+    Its references are the `item_files` rows with the same hash; blobs with
+    none are removed by the garbage-collection job once `last_referenced_at`
+    is older than the grace period.
+    """
+
+    __tablename__ = "file_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    storage_key = Column(String(512), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_referenced_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<FileBlob(sha256='{self.sha256}', size={self.size})>"
@@ -1,7 +1,18 @@
 """
 Item model for sample CRUD operations.
 """
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -17,9 +28,11 @@ class Item(Base):
     __tablename__ = "items"
 
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False, index=True)
+    title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
+    # Bumped by every update; clients send it back in If-Match
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -30,5 +43,62 @@ class Item(Base):
         nullable=False,
     )
 
+    # On PostgreSQL, migration 005 also adds a generated `search_vector`
+    # tsvector column with a GIN index and a pg_trgm index on title. They
+    # are left off the model so SQLite can still create the table; see
+    # ItemRepository.search. Migration 009 adds (title COLLATE "C", id)
+    # indexes for title_prefix ranges, which SQLite's title index already
+    # serves.
+    #
+    # Every sort offered by ItemRepository.get_all has a (column, id) index,
+    # plus a partial copy WHERE is_active for the default active-only lists.
+    __table_args__ = (
+        # Keyset pagination order: (created_at DESC, id DESC)
+        Index("ix_items_created_at_id", "created_at", "id"),
+        Index("ix_items_updated_at_id", "updated_at", "id"),
+        Index("ix_items_title_id", "title", "id"),
+        *(
+            Index(
+                f"ix_items_active_{'_'.join(columns)}",
+                *columns,
+                postgresql_where=text("is_active"),
+                sqlite_where=text("is_active"),
+            )
+            for columns in (
+                ("id",),
+                ("title", "id"),
+                ("created_at", "id"),
+                ("updated_at", "id"),
+            )
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Item(id={self.id}, title='{self.title}')>"
+
+
+# SQLite stand-in for the PostgreSQL search columns: an external-content
+# FTS5 index kept in sync by triggers
+for statement in (
+    "CREATE VIRTUAL TABLE items_fts USING fts5("
+    "title, description, content='items', content_rowid='id')",
+    "CREATE TRIGGER items_fts_insert AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER items_fts_delete AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER items_fts_update AFTER UPDATE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO items_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+):
+    event.listen(
+        Item.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Item.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS items_fts").execute_if(dialect="sqlite"),
+)
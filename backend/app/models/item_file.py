@@ -0,0 +1,32 @@
+"""
+ItemFile model for files uploaded with an item.
+"""
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ItemFile(Base):
+    """Metadata for a file persisted in storage and attached to an item."""
+
+    __tablename__ = "item_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(
+        Integer,
+        ForeignKey("items.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    filename = Column(String(255), nullable=False)
+    content_type = Column(String(255), nullable=False)
+    size = Column(BigInteger, nullable=False)
+    sha256 = Column(String(64), nullable=False, index=True)
+    storage_key = Column(String(512), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ItemFile(id={self.id}, filename='{self.filename}')>"
@@ -1,6 +1,7 @@
 """
 Repository layer package.
 """
+from app.repositories.file_blob import FileBlobRepository
 from app.repositories.item import ItemRepository
 
-__all__ = ["ItemRepository"]
+__all__ = ["ItemRepository", "FileBlobRepository"]
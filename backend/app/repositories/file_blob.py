@@ -0,0 +1,64 @@
+"""
+FileBlob repository for content-addressed storage metadata.
+"""
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.file_blob import FileBlob
+from app.models.item_file import ItemFile
+
+
+class FileBlobRepository:
+    """Repository for FileBlob data access operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def touch(self, hashes: Sequence[str]) -> dict[str, str]:
+        """
+        Mark existing blobs as just referenced and return their storage keys.
+
+        Touching protects a blob from garbage collection while the upload that
+        deduplicated against it is still being attached to an item.
+        """
+        if not hashes:
+            return {}
+        result = await self.db.execute(
+            update(FileBlob)
+            .where(FileBlob.sha256.in_(set(hashes)))
+            .values(last_referenced_at=func.now())
+            .returning(FileBlob.sha256, FileBlob.storage_key)
+        )
+        return dict(result.tuples().all())
+
+    async def add_many(self, blobs: Sequence[dict]) -> None:
+        """Record newly written blobs, ignoring ones a concurrent upload added."""
+        if not blobs:
+            return
+        dialect = postgresql if self.db.bind.dialect.name == "postgresql" else sqlite
+        await self.db.execute(
+            dialect.insert(FileBlob).values(list(blobs)).on_conflict_do_nothing()
+        )
+
+    async def delete_unreferenced(
+        self, older_than: datetime, limit: int = 1000
+    ) -> list[str]:
+        """Delete up to `limit` unreferenced blob rows, returning their keys."""
+        candidates = (
+            select(FileBlob.sha256)
+            .where(FileBlob.last_referenced_at < older_than)
+            .where(~exists().where(ItemFile.sha256 == FileBlob.sha256))
+            .limit(limit)
+        )
+        result = await self.db.execute(
+            delete(FileBlob)
+            .where(FileBlob.sha256.in_(candidates))
+            # Re-checked on the locked row, so a concurrent touch() wins
+            .where(FileBlob.last_referenced_at < older_than)
+            .returning(FileBlob.storage_key)
+        )
+        return list(result.scalars().all())
@@ -1,75 +1,665 @@
 """
 Item repository for data access operations.
 """
-from sqlalchemy import delete, select, update
+import json
+import re
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Float,
+    Integer,
+    Row,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.events import notify_payload
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.models.item_file import ItemFile
+from app.schemas.item import (
+    DEFAULT_SORT,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilter,
+    ItemSort,
+    ItemUpdate,
+)
+
+# Shared across requests; cleared on every write through this repository
+count_cache = TTLCache(ttl=settings.ITEM_COUNT_CACHE_TTL)
+
+# Columns of ItemResponse, in output order. Exports and list responses
+# select just these, skipping ORM entity construction.
+ITEM_COLUMNS = (
+    Item.id,
+    Item.title,
+    Item.description,
+    Item.is_active,
+    Item.created_at,
+    Item.updated_at,
+    Item.version,
+)
+
+# Text search configuration of the generated items.search_vector column
+SEARCH_CONFIG = "simple"
+
+# SQLite FTS5 index created alongside the items table (see app.models.item)
+items_fts = table("items_fts", column("rowid"))
+
+# Sortable columns. Each has a (column, id) index plus a partial copy
+# WHERE is_active, so every sort is index-ordered with or without the
+# is_active filter.
+SORT_COLUMNS = {
+    "id": Item.id,
+    "title": Item.title,
+    "created_at": Item.created_at,
+    "updated_at": Item.updated_at,
+}
+
+# Range filters and the column each one constrains
+RANGE_FILTERS = {
+    "title_prefix": "title",
+    "created_after": "created_at",
+    "created_before": "created_at",
+    "updated_after": "updated_at",
+    "updated_before": "updated_at",
+}
+
+T = TypeVar("T")
+
+
+def _columns(fields: Sequence[str] | None) -> list[ColumnElement]:
+    """
+    ITEM_COLUMNS narrowed to `fields` plus id, in their usual order.
+
+    Raises:
+        ValueError: If a field is not an item column.
+    """
+    if fields is None:
+        return list(ITEM_COLUMNS)
+    unknown = set(fields) - {column.key for column in ITEM_COLUMNS}
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    wanted = {"id", *fields}
+    return [column for column in ITEM_COLUMNS if column.key in wanted]
+
+
+def _prefix_successor(prefix: str) -> str | None:
+    """Smallest string above every string starting with `prefix`, by code point."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < sys.maxunicode:
+            # Surrogates are not valid in stored text; skip over them
+            successor = 0xE000 if last + 1 == 0xD800 else last + 1
+            return prefix[:-1] + chr(successor)
+        prefix = prefix[:-1]
+    return None
+
+
+def _title_prefix(prefix: str, dialect: str) -> list[ColumnElement[bool]]:
+    """
+    Conditions matching titles that start with `prefix`.
+
+    In code point order a prefix's matches are one contiguous range, so
+    bounding both ends lets an index scan stop right after the last match.
+    PostgreSQL compares under the "C" collation for that, which the
+    ix_items_*title_c_id indexes from migration 009 are built with;
+    SQLite's default collation already is code point order. The lower
+    bound in the column's own collation lets the (title, id) sort index
+    start at the prefix as well.
+    """
+    conditions = [
+        Item.title >= prefix,
+        Item.title.startswith(prefix, autoescape=True),
+    ]
+    title = Item.title
+    if dialect == "postgresql":
+        title = Item.title.collate("C")
+        conditions.append(title >= prefix)
+    if (upper := _prefix_successor(prefix)) is not None:
+        conditions.append(title < upper)
+    return conditions
+
+
+def _filtered(
+    query: Select, active_only: bool, filters: ItemFilter, dialect: str
+) -> Select:
+    """Apply list filters to a select on items."""
+    is_active = filters.is_active
+    if is_active is None and active_only:
+        is_active = True
+    if is_active is not None:
+        query = query.where(Item.is_active == is_active)
+    if filters.title_prefix is not None:
+        query = query.where(*_title_prefix(filters.title_prefix, dialect))
+    if filters.created_after is not None:
+        query = query.where(Item.created_at >= filters.created_after)
+    if filters.created_before is not None:
+        query = query.where(Item.created_at < filters.created_before)
+    if filters.updated_after is not None:
+        query = query.where(Item.updated_at >= filters.updated_after)
+    if filters.updated_before is not None:
+        query = query.where(Item.updated_at < filters.updated_before)
+    return query
+
+
+def check_index_support(filters: ItemFilter, sort: ItemSort) -> None:
+    """
+    Reject filter and sort combinations that no index can serve.
+
+    A B-tree can only narrow a range on its leading column while still
+    returning rows in order, so range filters must be on the sort column.
+
+    Raises:
+        ValueError: If a range filter is on a column other than the sort.
+    """
+    field = sort.lstrip("-")
+    for name, column_name in RANGE_FILTERS.items():
+        if getattr(filters, name) is not None and column_name != field:
+            raise ValueError(
+                f"Filtering by {name} requires sorting by {column_name} "
+                f"or -{column_name}"
+            )
+
+
+# Called with the IDs of each chunk's rows right after the chunk commits
+OnCommit = Callable[[list[int]], Awaitable[None]]
+
+
+def _chunks(values: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most `size` elements."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
 
 
 class ItemRepository:
-    """Repository for Item data access operations."""
+    """
+    Repository for Item data access operations.
+
+    With `notify_channel`, every write also sends one NOTIFY naming the
+    items it changed, per statement or bulk chunk, in its own transaction.
+    """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, notify_channel: str | None = None):
         self.db = db
+        self.notify_channel = notify_channel
+
+    async def _notify(self, event_type: str, item_ids: Sequence[int]) -> None:
+        """Queue a NOTIFY for `item_ids`; PostgreSQL delivers it on commit."""
+        if self.notify_channel is None or not item_ids:
+            return
+        await self.db.execute(
+            select(
+                func.pg_notify(
+                    self.notify_channel, notify_payload(event_type, tuple(item_ids))
+                )
+            )
+        )
 
     async def create(self, item_data: ItemCreate) -> Item:
         """Create a new item."""
         item = Item(**item_data.model_dump())
         self.db.add(item)
+        await self.db.flush()
+        await self._notify("created", [item.id])
         await self.db.commit()
+        count_cache.clear()
         await self.db.refresh(item)
         return item
 
+    async def create_with_files(
+        self, item_data: ItemCreate, files: Sequence[dict]
+    ) -> tuple[Item, list[ItemFile]]:
+        """Create an item and its file metadata rows in one transaction."""
+        item = Item(**item_data.model_dump())
+        self.db.add(item)
+        await self.db.flush()
+
+        item_files = [ItemFile(item_id=item.id, **metadata) for metadata in files]
+        self.db.add_all(item_files)
+        await self._notify("created", [item.id])
+        await self.db.commit()
+        count_cache.clear()
+        await self.db.refresh(item)
+        return item, item_files
+
     async def get_by_id(self, item_id: int) -> Item | None:
         """Get item by ID."""
         result = await self.db.execute(select(Item).where(Item.id == item_id))
         return result.scalar_one_or_none()
 
+    async def get_row(
+        self, item_id: int, fields: Sequence[str] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Get one item's columns as a dict, only `fields` (plus id) if given.
+
+        Raises:
+            ValueError: If a field is unknown.
+        """
+        result = await self.db.execute(
+            select(*_columns(fields)).where(Item.id == item_id)
+        )
+        row = result.mappings().one_or_none()
+        return dict(row) if row is not None else None
+
+    async def get_version(self, item_id: int) -> tuple[int, datetime] | None:
+        """Get just an item's `(version, updated_at)`, or None if missing."""
+        result = await self.db.execute(
+            select(Item.version, Item.updated_at).where(Item.id == item_id)
+        )
+        row = result.one_or_none()
+        return tuple(row) if row is not None else None
+
+    async def get_file(self, item_id: int, file_id: int) -> ItemFile | None:
+        """Get a file attached to an item."""
+        result = await self.db.execute(
+            select(ItemFile).where(ItemFile.id == file_id, ItemFile.item_id == item_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_all(
-        self, skip: int = 0, limit: int = 100, active_only: bool = True
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        after: tuple[Any, int] | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort = DEFAULT_SORT,
     ) -> list[Item]:
-        """Get all items with pagination."""
-        query = select(Item)
+        """
+        Get all items with pagination, filtering and sorting.
+
+        `filters.is_active`, when set, overrides `active_only`. When `after`
+        is given, pages by keyset on `(sort column, id)` and `skip` is
+        ignored, so deep pages cost the same as the first one.
+
+        Raises:
+            ValueError: If no index can serve the filter and sort combination.
+        """
+        query = self._list_query(
+            select(Item), skip, limit, active_only, after, filters, sort
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_all_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        after: tuple[Any, int] | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort = DEFAULT_SORT,
+        fields: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Same as `get_all`, but selects ITEM_COLUMNS into plain dicts.
+
+        With `fields`, only those columns (plus id) are selected.
+
+        Raises:
+            ValueError: If a field is unknown, or no index can serve the
+                filter and sort combination.
+        """
+        query = self._list_query(
+            select(*_columns(fields)), skip, limit, active_only, after, filters, sort
+        )
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+    def _list_query(
+        self,
+        query: Select,
+        skip: int,
+        limit: int,
+        active_only: bool,
+        after: tuple[Any, int] | None,
+        filters: ItemFilter | None,
+        sort: ItemSort,
+    ) -> Select:
+        """Apply list filters, ordering and pagination to a select on items."""
+        filters = filters or ItemFilter()
+        check_index_support(filters, sort)
+        field = sort.lstrip("-")
+        sort_column = SORT_COLUMNS[field]
+        descending = sort.startswith("-")
+
+        query = _filtered(query, active_only, filters, self.db.bind.dialect.name)
+        if after is not None:
+            value, item_id = after
+            if descending:
+                position = or_(
+                    sort_column < value,
+                    and_(sort_column == value, Item.id < item_id),
+                )
+            else:
+                position = or_(
+                    sort_column > value,
+                    and_(sort_column == value, Item.id > item_id),
+                )
+            query = query.where(position)
+        else:
+            query = query.offset(skip)
+
+        order = (sort_column, Item.id) if field != "id" else (Item.id,)
+        query = query.limit(limit).order_by(
+            *(column.desc() if descending else column.asc() for column in order)
+        )
+
+        return query
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        active_only: bool = True,
+        after: tuple[float, int] | None = None,
+    ) -> list[tuple[Item, float]]:
+        """
+        Find items matching `query_text`, best match first, with their rank.
+
+        PostgreSQL matches the `search_vector` column using web search
+        syntax, plus trigram similarity and prefix matches on the title so
+        typos and partial words still hit. SQLite uses its FTS5 index with
+        prefix matching on every word. When `after` is given, pages by
+        keyset on `(rank, id)`.
+        """
+        if self.db.bind.dialect.name == "postgresql":
+            rank, match = self._postgresql_search(query_text)
+            query = select(Item, rank).where(match)
+        else:
+            terms = re.findall(r"\w+", query_text)
+            if not terms:
+                return []
+            # bm25() scores better matches lower
+            rank = -func.bm25(literal_column("items_fts"))
+            query = (
+                select(Item, rank)
+                .join(items_fts, items_fts.c.rowid == Item.id)
+                .where(
+                    literal_column("items_fts").op("MATCH")(
+                        " ".join(f'"{term}"*' for term in terms)
+                    )
+                )
+            )
+
         if active_only:
             query = query.where(Item.is_active == True)  # noqa: E712
-        query = query.offset(skip).limit(limit).order_by(Item.created_at.desc())
+        if after is not None:
+            after_rank, item_id = after
+            query = query.where(
+                or_(rank < after_rank, and_(rank == after_rank, Item.id < item_id))
+            )
+        query = query.order_by(rank.desc(), Item.id.desc()).limit(limit)
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return [(item, item_rank) for item, item_rank in result.all()]
 
-    async def update(self, item_id: int, item_data: ItemUpdate) -> Item | None:
-        """Update an existing item."""
-        # Get the current item
-        item = await self.get_by_id(item_id)
-        if not item:
-            return None
+    @staticmethod
+    def _postgresql_search(
+        query_text: str,
+    ) -> tuple[ColumnElement[float], ColumnElement[bool]]:
+        """Rank expression and match condition using the GIN-indexed columns."""
+        vector = literal_column("items.search_vector")
+        tsquery = func.websearch_to_tsquery(
+            literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query_text
+        )
+        rank = cast(func.ts_rank_cd(vector, tsquery), Float) + cast(
+            func.similarity(Item.title, query_text), Float
+        )
+        match = or_(
+            vector.op("@@")(tsquery),
+            Item.title.op("%")(query_text),
+            Item.title.istartswith(query_text, autoescape=True),
+        )
+        return rank, match
+
+    async def stream_all(
+        self, active_only: bool = True, batch_size: int = settings.EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream every item as column tuples, `batch_size` rows at a time.
+
+        Uses a server-side cursor so memory stays flat regardless of table
+        size.
+        """
+        query = select(*ITEM_COLUMNS)
+        if active_only:
+            query = query.where(Item.is_active == True)  # noqa: E712
+        query = query.order_by(Item.id).execution_options(yield_per=batch_size)
+
+        result = await self.db.stream(query)
+        async for partition in result.partitions():
+            yield partition
 
+    async def update(
+        self,
+        item_id: int,
+        item_data: ItemUpdate,
+        expected_version: int | None = None,
+    ) -> Item | None:
+        """
+        Update an existing item with a single UPDATE ... RETURNING.
+
+        With `expected_version`, the UPDATE only matches that version, so
+        concurrent writers never overwrite each other without locking.
+        Returns None if no row matched, whether missing or at another
+        version.
+        """
         # Update only provided fields
         update_data = item_data.model_dump(exclude_unset=True)
         if not update_data:
+            item = await self.get_by_id(item_id)
+            if item is not None and expected_version not in (None, item.version):
+                return None
             return item
 
-        await self.db.execute(
-            update(Item).where(Item.id == item_id).values(**update_data)
+        query = update(Item).where(Item.id == item_id)
+        if expected_version is not None:
+            query = query.where(Item.version == expected_version)
+        result = await self.db.scalars(
+            query.values(**update_data, version=Item.version + 1)
+            .returning(Item)
+            .execution_options(populate_existing=True)
         )
+        item = result.one_or_none()
+        if item is not None:
+            await self._notify("updated", [item.id])
         await self.db.commit()
-
-        # Return updated item
-        return await self.get_by_id(item_id)
+        if item is not None:
+            count_cache.clear()
+        return item
 
     async def delete(self, item_id: int) -> bool:
-        """Delete an item."""
-        result = await self.db.execute(delete(Item).where(Item.id == item_id))
+        """Delete an item with a single DELETE ... RETURNING."""
+        result = await self.db.execute(
+            delete(Item).where(Item.id == item_id).returning(Item.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            await self._notify("deleted", [item_id])
         await self.db.commit()
-        return result.rowcount > 0
+        if deleted:
+            count_cache.clear()
+        return deleted
 
-    async def count(self, active_only: bool = True) -> int:
-        """Count total items."""
-        query = select(Item.id)
-        if active_only:
-            query = query.where(Item.is_active == True)  # noqa: E712
+    async def bulk_create(
+        self,
+        items: Sequence[ItemCreate],
+        chunk_size: int = settings.BULK_CHUNK_SIZE,
+        on_commit: OnCommit | None = None,
+    ) -> list[Item]:
+        """
+        Create items with one multi-row INSERT ... RETURNING per chunk.
 
-        result = await self.db.execute(query)
-        return len(list(result.scalars().all()))
+        Each chunk is committed on its own, so a failure leaves earlier
+        chunks in place; `on_commit` hears about each one as it commits.
+        """
+        created = []
+        for chunk in _chunks(items, chunk_size):
+            result = await self.db.scalars(
+                insert(Item).returning(Item, sort_by_parameter_order=True),
+                [item.model_dump() for item in chunk],
+            )
+            rows = result.all()
+            created.extend(rows)
+            await self._notify("created", [item.id for item in rows])
+            await self.db.commit()
+            count_cache.clear()
+            if on_commit is not None:
+                await on_commit([item.id for item in rows])
+        return created
+
+    async def bulk_update(
+        self,
+        items: Sequence[ItemBulkUpdate],
+        chunk_size: int = settings.BULK_CHUNK_SIZE,
+        on_commit: OnCommit | None = None,
+    ) -> list[Item]:
+        """
+        Update items with executemany UPDATEs, one chunk per transaction.
+
+        Entries are grouped by the set of fields they change so each group is
+        a single executemany. Unknown IDs are skipped; the updated rows are
+        returned in ID order. `on_commit` is called after each chunk.
+        """
+        updated = []
+        for chunk in _chunks(items, chunk_size):
+            groups: dict[tuple[str, ...], list[dict]] = {}
+            for item in chunk:
+                values = item.model_dump(exclude_unset=True, exclude={"id"})
+                if values:
+                    groups.setdefault(tuple(sorted(values)), []).append(
+                        {"_id": item.id, **values}
+                    )
+
+            for fields, params in groups.items():
+                statement = (
+                    update(Item.__table__)
+                    .where(Item.id == bindparam("_id"))
+                    .values(
+                        {
+                            **{field: bindparam(field) for field in fields},
+                            "version": Item.__table__.c.version + 1,
+                        }
+                    )
+                )
+                await self.db.execute(statement, params)
+
+            result = await self.db.scalars(
+                select(Item)
+                .where(self._id_in([item.id for item in chunk]))
+                .order_by(Item.id)
+                .execution_options(populate_existing=True)
+            )
+            rows = result.all()
+            updated.extend(rows)
+            await self._notify("updated", [item.id for item in rows])
+            await self.db.commit()
+            count_cache.clear()
+            if on_commit is not None:
+                await on_commit([item.id for item in rows])
+        return updated
+
+    async def bulk_delete(
+        self,
+        item_ids: Sequence[int],
+        chunk_size: int = settings.BULK_CHUNK_SIZE,
+        on_commit: OnCommit | None = None,
+    ) -> int:
+        """
+        Delete items by ID, one statement and transaction per chunk.
+
+        `on_commit` gets the IDs each chunk actually deleted.
+        """
+        deleted = 0
+        for chunk in _chunks(item_ids, chunk_size):
+            result = await self.db.scalars(
+                delete(Item).where(self._id_in(chunk)).returning(Item.id)
+            )
+            ids = list(result.all())
+            deleted += len(ids)
+            await self._notify("deleted", ids)
+            await self.db.commit()
+            count_cache.clear()
+            if on_commit is not None:
+                await on_commit(ids)
+        return deleted
+
+    def _id_in(self, item_ids: Sequence[int]) -> ColumnElement[bool]:
+        """Match a list of IDs, as a single array parameter on PostgreSQL."""
+        if self.db.bind.dialect.name == "postgresql":
+            return Item.id == any_(literal(list(item_ids), ARRAY(Integer)))
+        return Item.id.in_(item_ids)
+
+    async def count(self, active_only: bool = True, approximate: bool = False) -> int:
+        """
+        Count total items.
+
+        With `approximate`, PostgreSQL answers from planner statistics instead
+        of scanning; other databases, and tables never analyzed, fall back to
+        an exact count. Results are cached for ITEM_COUNT_CACHE_TTL seconds;
+        replica sessions read the cache but never fill it, since a lagging
+        replica could put back a count that a write just cleared.
+        """
+        key = (active_only, approximate)
+        cached = count_cache.get(key)
+        if cached is not None:
+            return cached
+
+        total = None
+        if approximate and self.db.bind.dialect.name == "postgresql":
+            total = await self._estimate_count(active_only)
+        if total is None:
+            query = select(func.count()).select_from(Item)
+            if active_only:
+                query = query.where(Item.is_active == True)  # noqa: E712
+            total = (await self.db.execute(query)).scalar_one()
+
+        if "replica" not in self.db.info:
+            count_cache.set(key, total)
+        return total
+
+    async def _estimate_count(self, active_only: bool) -> int | None:
+        """Read the PostgreSQL row estimate, or None if there are no statistics."""
+        if not active_only:
+            result = await self.db.execute(
+                text("SELECT reltuples FROM pg_class WHERE oid = 'items'::regclass")
+            )
+            estimate = result.scalar()
+        else:
+            result = await self.db.execute(
+                text("EXPLAIN (FORMAT JSON) SELECT 1 FROM items WHERE is_active")
+            )
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+        # reltuples is -1 until the table is first vacuumed or analyzed
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
@@ -1,6 +1,22 @@
 """
 Pydantic schemas package.
 """
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from app.schemas.item import (
+    ItemBulkDelete,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilter,
+    ItemResponse,
+    ItemSort,
+    ItemUpdate,
+)
 
-__all__ = ["ItemCreate", "ItemUpdate", "ItemResponse"]
+__all__ = [
+    "ItemCreate",
+    "ItemUpdate",
+    "ItemBulkUpdate",
+    "ItemBulkDelete",
+    "ItemFilter",
+    "ItemSort",
+    "ItemResponse",
+]
@@ -2,9 +2,23 @@
 Pydantic schemas for Item model.
 """
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Sort keys for item lists; a leading "-" sorts descending. Ties break on id.
+ItemSort = Literal[
+    "id",
+    "-id",
+    "title",
+    "-title",
+    "created_at",
+    "-created_at",
+    "updated_at",
+    "-updated_at",
+]
+DEFAULT_SORT: ItemSort = "-created_at"
+
 
 class ItemBase(BaseModel):
     """Base schema for Item."""
@@ -30,11 +44,37 @@ class ItemUpdate(BaseModel):
     is_active: bool | None = Field(None, description="Whether the item is active")
 
 
+class ItemBulkUpdate(ItemUpdate):
+    """Schema for one entry of a bulk update."""
+
+    id: int = Field(..., description="ID of the item to update")
+
+
+class ItemBulkDelete(BaseModel):
+    """Schema for a bulk delete request."""
+
+    ids: list[int] = Field(..., min_length=1, description="IDs of items to delete")
+
+
+class ItemFilter(BaseModel):
+    """Filters for item lists. Unset fields do not filter."""
+
+    title_prefix: str | None = Field(
+        None, min_length=1, max_length=255, description="Case-sensitive title prefix"
+    )
+    created_after: datetime | None = Field(None, description="Created at or after")
+    created_before: datetime | None = Field(None, description="Created before")
+    updated_after: datetime | None = Field(None, description="Updated at or after")
+    updated_before: datetime | None = Field(None, description="Updated before")
+    is_active: bool | None = Field(None, description="Whether the item is active")
+
+
 class ItemResponse(ItemBase):
     """Schema for item response."""
 
     model_config = ConfigDict(from_attributes=True)
 
     id: int = Field(..., description="Item ID")
+    version: int = Field(..., description="Incremented on every update")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
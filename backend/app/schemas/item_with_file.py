@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import Form, UploadFile
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, validator
 
 
 class ItemFileBase(BaseModel):
@@ -29,6 +29,25 @@ class ItemFileResponse(ItemFileBase):
         from_attributes = True
 
 
+class ItemFileRead(BaseModel):
+    """저장된 파일 메타데이터"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    item_id: int
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+    storage_key: str = Field(exclude=True)
+
+    @computed_field
+    @property
+    def file_url(self) -> str:
+        return f"/api/items/{self.item_id}/files/{self.id}"
+
+
 class ItemFileValidationError(BaseModel):
     field: str
     code: str
@@ -57,7 +76,7 @@ def validate_file(file: UploadFile = Form(...), max_size: int = 5 * 1024 * 1024)
         'text/plain',
     ]
 
-    if file.type not in allowed_types:
+    if file.content_type not in allowed_types:
         raise ValueError("허용되지 않는 파일 형식입니다. JPEG, PNG, WebP, PDF, 만 허용됩니다")
 
     return file
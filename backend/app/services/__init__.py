@@ -1,6 +1,7 @@
 """
 Service layer package.
 """
-from app.services.item import ItemService
+from app.services.file_blob import FileBlobService
+from app.services.item import ItemService, VersionConflict
 
-__all__ = ["ItemService"]
+__all__ = ["ItemService", "FileBlobService", "VersionConflict"]
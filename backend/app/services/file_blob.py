@@ -0,0 +1,141 @@
+"""
+FileBlob service for content-addressed upload storage.
+"""
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repositories.file_blob import FileBlobRepository
+from app.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+
+def blob_key(sha256: str) -> str:
+    """Storage key for the blob with the given content hash."""
+    return f"blobs/{sha256[:2]}/{sha256}"
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+async def _digest(file: UploadFile, max_size: int) -> tuple[str, int]:
+    """Hash an upload in one streaming pass and rewind it."""
+    digest = hashlib.sha256()
+    size = 0
+    async for chunk in _iter_upload(file):
+        size += len(chunk)
+        if size > max_size:
+            raise ValueError(
+                f"파일 크기는 최대 {max_size / (1024 * 1024):.1f}MB여야 합니다"
+            )
+        digest.update(chunk)
+    await file.seek(0)
+    return digest.hexdigest(), size
+
+
+class FileBlobService:
+    """Service for deduplicated file storage."""
+
+    def __init__(self, db: AsyncSession, storage: StorageBackend):
+        self.db = db
+        self.repository = FileBlobRepository(db)
+        self.storage = storage
+
+    async def store_uploads(self, files: list[UploadFile]) -> list[dict]:
+        """
+        Store uploads by content hash and return their file metadata.
+
+        Each upload is hashed first; content already in storage costs only
+        that pass, and only new content is written, concurrently.
+
+        Raises:
+            ValueError: If an upload exceeds UPLOAD_MAX_SIZE.
+        """
+        digests = await asyncio.gather(
+            *(_digest(file, settings.UPLOAD_MAX_SIZE) for file in files)
+        )
+        keys = await self.repository.touch([sha256 for sha256, _ in digests])
+
+        # One write per distinct new hash, even if it was uploaded twice
+        pending: dict[str, UploadFile] = {}
+        for file, (sha256, _) in zip(files, digests, strict=True):
+            if sha256 not in keys:
+                pending.setdefault(sha256, file)
+
+        results = await asyncio.gather(
+            *(
+                self.storage.save(blob_key(sha256), _iter_upload(file))
+                for sha256, file in pending.items()
+            ),
+            return_exceptions=True,
+        )
+        stored = {
+            sha256: result
+            for sha256, result in zip(pending, results, strict=True)
+            if not isinstance(result, BaseException)
+        }
+        # Recorded even if another write failed: a concurrent upload of the
+        # same content may be using the object, so it is never deleted here
+        # but left to collect_garbage once unreferenced past the grace period
+        await self.repository.add_many(
+            [
+                {"sha256": sha256, "size": result.size, "storage_key": result.key}
+                for sha256, result in stored.items()
+            ]
+        )
+        await self.db.commit()
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
+        keys.update({sha256: blob_key(sha256) for sha256 in pending})
+
+        return [
+            {
+                "filename": file.filename or sha256,
+                "content_type": file.content_type,
+                "size": size,
+                "sha256": sha256,
+                "storage_key": keys[sha256],
+            }
+            for file, (sha256, size) in zip(files, digests, strict=True)
+        ]
+
+    async def collect_garbage(
+        self,
+        grace: timedelta = timedelta(seconds=settings.FILE_BLOB_GC_GRACE_SECONDS),
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Delete blobs no item file references, in batches.
+
+        Only blobs unreferenced for longer than `grace` are collected, so
+        uploads that are still being attached to an item are left alone.
+        Objects are deleted while the batch's rows are still locked: an
+        upload of the same content waits in touch() until the commit, then
+        finds no row and writes the object afresh.
+        """
+        older_than = datetime.now(UTC) - grace
+        collected = 0
+        while True:
+            keys = await self.repository.delete_unreferenced(older_than, batch_size)
+            try:
+                for key in keys:
+                    await self.storage.delete(key)
+            finally:
+                # Rows go even if an object is left behind: an orphaned object
+                # only wastes space, a row without one breaks deduplication
+                await self.db.commit()
+            collected += len(keys)
+            if len(keys) < batch_size:
+                break
+        logger.info("Collected %d unreferenced file blobs", collected)
+        return collected
@@ -1,55 +1,353 @@
 """
 Item service for business logic operations.
 """
+from collections.abc import AsyncIterator
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories.item import ItemRepository
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from app.core.cache import CacheBackend, get_item_cache
+from app.core.config import settings
+from app.core.events import EventBroadcaster, get_item_events
+from app.core.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from app.repositories.item import ITEM_COLUMNS, ItemRepository
+from app.schemas.item import (
+    DEFAULT_SORT,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilter,
+    ItemResponse,
+    ItemSort,
+    ItemUpdate,
+)
+from app.schemas.item_with_file import ItemFileRead
+from app.services.item_export import (
+    ExportFormat,
+    encode_csv,
+    encode_ndjson,
+    gzip_stream,
+)
+
+# Bumped after every committed write and part of every item and list key.
+# Readers take it before querying, so a read racing a write can only fill
+# a key no later reader looks up.
+GENERATION_KEY = "generation"
+
+
+class VersionConflict(Exception):
+    """The item was changed since the version the caller expected."""
+
+
+def _decode_position(cursor: str, sort: ItemSort) -> tuple[Any, int]:
+    """Decode a list cursor into a keyset position typed for the sort column."""
+    value, item_id = decode_cursor(cursor, sort)
+    field = sort.lstrip("-")
+    if field in ("created_at", "updated_at") and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value), item_id
+        except ValueError as e:
+            raise ValueError("Invalid cursor") from e
+    if (field == "id") == isinstance(value, int):
+        return value, item_id
+    raise ValueError("Invalid cursor")
 
 
 class ItemService:
-    """Service for Item business logic operations."""
+    """
+    Service for Item business logic operations.
+
+    Single items and the first ITEM_CACHE_PAGES offset pages are read
+    through `cache`; every write invalidates all of them at once. Reads
+    on a replica session use the cache but never fill it, since a lagging
+    replica could put back what a write just invalidated.
+
+    Committed writes are also announced to `events`, feeding the live
+    change stream; backends with a `notify_channel` hear of them from the
+    repository's NOTIFYs instead.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: CacheBackend | None = None,
+        events: EventBroadcaster | None = None,
+    ):
+        self.events = events if events is not None else get_item_events()
+        self.repository = ItemRepository(db, self.events.notify_channel)
+        if cache is None and settings.ITEM_CACHE_ENABLED:
+            cache = get_item_cache()
+        self.cache = cache
+        self.fill_cache = cache is not None and "replica" not in db.info
+
+    async def _invalidate(self) -> None:
+        """Retire every cached item and list page by moving to a new generation."""
+        if self.cache is None:
+            return
+        await self.cache.incr(GENERATION_KEY)
+
+    async def _changed(self, event_type: str, item_ids: list[int]) -> None:
+        """Invalidate the cache and announce a committed write to `item_ids`."""
+        await self._invalidate()
+        if item_ids:
+            self.events.publish(event_type, *item_ids)
 
-    def __init__(self, db: AsyncSession):
-        self.repository = ItemRepository(db)
+    async def create_item(
+        self, item_data: ItemCreate | dict, file_metadata: dict | None = None
+    ) -> ItemResponse:
+        """
+        Create a new item with business logic validation.
+
+        `file_metadata` describes files already written to storage, either a
+        single file or `{"files": [...]}`; each is recorded against the item.
+        """
+        if file_metadata is not None:
+            files = file_metadata.get("files", [file_metadata])
+            item, _ = await self.create_item_with_files(item_data, files)
+            return item
 
-    async def create_item(self, item_data: ItemCreate | dict, file_metadata: dict | None = None) -> ItemResponse:
-        """Create a new item with business logic validation."""
         # Add any business logic here (validation, processing, etc.)
+        if isinstance(item_data, dict):
+            item_data = ItemCreate(**item_data)
         item = await self.repository.create(item_data)
+        await self._changed("created", [item.id])
         return ItemResponse.model_validate(item)
 
+    async def create_item_with_files(
+        self, item_data: ItemCreate | dict, files: list[dict]
+    ) -> tuple[ItemResponse, list[ItemFileRead]]:
+        """Create an item together with metadata for its stored files."""
+        if isinstance(item_data, dict):
+            item_data = ItemCreate(**item_data)
+        item, item_files = await self.repository.create_with_files(item_data, files)
+        await self._changed("created", [item.id])
+        return (
+            ItemResponse.model_validate(item),
+            [ItemFileRead.model_validate(item_file) for item_file in item_files],
+        )
+
     async def get_item(self, item_id: int) -> ItemResponse | None:
         """Get item by ID."""
+        if self.cache is not None:
+            generation = await self.cache.counter(GENERATION_KEY)
+            key = f"item:{generation}:{item_id}"
+            if cached := await self.cache.get(key):
+                return ItemResponse.model_validate_json(cached)
+
         item = await self.repository.get_by_id(item_id)
         if not item:
             return None
-        return ItemResponse.model_validate(item)
+        response = ItemResponse.model_validate(item)
+        if self.fill_cache:
+            await self.cache.set(
+                key, response.model_dump_json().encode(), settings.ITEM_CACHE_TTL
+            )
+        return response
+
+    async def get_item_fields(
+        self, item_id: int, fields: list[str]
+    ) -> dict[str, Any] | None:
+        """
+        Get only the given fields (plus id) of an item, as a dict.
+
+        Reads just those columns, bypassing the item cache.
+
+        Raises:
+            ValueError: If a field is unknown.
+        """
+        return await self.repository.get_row(item_id, fields)
+
+    async def get_item_version(self, item_id: int) -> tuple[int, datetime] | None:
+        """Get an item's `(version, updated_at)` without loading the row."""
+        return await self.repository.get_version(item_id)
+
+    async def get_item_file(self, item_id: int, file_id: int) -> ItemFileRead | None:
+        """Get metadata for a file attached to an item."""
+        item_file = await self.repository.get_file(item_id, file_id)
+        if not item_file:
+            return None
+        return ItemFileRead.model_validate(item_file)
 
     async def get_items(
-        self, skip: int = 0, limit: int = 100, active_only: bool = True
-    ) -> list[ItemResponse]:
-        """Get all items with pagination."""
-        items = await self.repository.get_all(
-            skip=skip, limit=limit, active_only=active_only
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+        cursor: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort = DEFAULT_SORT,
+        fields: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Get all items with pagination, filtering and sorting.
+
+        Items come back as plain dicts shaped like `ItemResponse`, read
+        straight from the selected columns so they can be encoded without
+        building or validating a model per row. With `fields`, only those
+        keys (plus id) are selected and returned.
+
+        Returns the page and, if it is full, the cursor for the next one.
+
+        Raises:
+            ValueError: If `cursor` is malformed, a field is unknown, or no
+                index can serve the filter and sort combination.
+        """
+        after = _decode_position(cursor, sort) if cursor else None
+        key = None
+        if (
+            self.cache is not None
+            and after is None
+            and not (filters and filters.model_dump(exclude_none=True))
+            and skip < settings.ITEM_CACHE_PAGES * limit
+        ):
+            generation = await self.cache.counter(GENERATION_KEY)
+            projection = ",".join(sorted(fields)) if fields else "*"
+            key = (
+                f"list:{generation}:{int(active_only)}:{sort}:{projection}:"
+                f"{skip}:{limit}"
+            )
+            if cached := await self.cache.get(key):
+                items, next_cursor = orjson.loads(cached)
+                return items, next_cursor
+
+        # The sort column is needed for the next cursor even if not requested
+        field = sort.lstrip("-")
+        items = await self.repository.get_all_rows(
+            skip=skip,
+            limit=limit,
+            active_only=active_only,
+            after=after,
+            filters=filters,
+            sort=sort,
+            fields=[*fields, field] if fields else None,
         )
-        return [ItemResponse.model_validate(item) for item in items]
+        next_cursor = None
+        if len(items) == limit:
+            last = items[-1]
+            next_cursor = encode_cursor(sort, last[field], last["id"])
+        if fields and field not in fields and field != "id":
+            for item in items:
+                del item[field]
+
+        if key is not None and self.fill_cache:
+            await self.cache.set(
+                key,
+                orjson.dumps([items, next_cursor], option=orjson.OPT_UTC_Z),
+                settings.ITEM_CACHE_TTL,
+            )
+        return items, next_cursor
+
+    async def search_items(
+        self,
+        query_text: str,
+        limit: int = 20,
+        active_only: bool = True,
+        cursor: str | None = None,
+    ) -> tuple[list[ItemResponse], str | None]:
+        """
+        Search items by title and description, best match first.
+
+        Returns the page and, if it is full, the cursor for the next one.
+
+        Raises:
+            ValueError: If `cursor` is malformed.
+        """
+        after = decode_rank_cursor(cursor) if cursor else None
+        results = await self.repository.search(
+            query_text, limit=limit, active_only=active_only, after=after
+        )
+        next_cursor = None
+        if len(results) == limit:
+            last, rank = results[-1]
+            next_cursor = encode_rank_cursor(rank, last.id)
+        return [ItemResponse.model_validate(item) for item, _ in results], next_cursor
 
     async def update_item(
-        self, item_id: int, item_data: ItemUpdate
+        self,
+        item_id: int,
+        item_data: ItemUpdate,
+        expected_version: int | None = None,
     ) -> ItemResponse | None:
-        """Update an existing item."""
+        """
+        Update an existing item, optionally only at `expected_version`.
+
+        Raises:
+            VersionConflict: If the item exists at a different version.
+        """
         # Add any business logic here (validation, processing, etc.)
-        item = await self.repository.update(item_id, item_data)
+        item = await self.repository.update(item_id, item_data, expected_version)
         if not item:
+            # Only a failed update pays for telling a conflict from a 404
+            conflict = (
+                expected_version is not None
+                and await self.repository.get_version(item_id) is not None
+            )
+            if conflict:
+                raise VersionConflict(item_id)
             return None
+        await self._changed("updated", [item_id])
         return ItemResponse.model_validate(item)
 
     async def delete_item(self, item_id: int) -> bool:
         """Delete an item."""
         # Add any business logic here (cascade deletes, validation, etc.)
-        return await self.repository.delete(item_id)
+        deleted = await self.repository.delete(item_id)
+        await self._changed("deleted", [item_id] if deleted else [])
+        return deleted
 
-    async def get_item_count(self, active_only: bool = True) -> int:
+    async def bulk_create_items(
+        self, items: list[ItemCreate], chunk_size: int = settings.BULK_CHUNK_SIZE
+    ) -> list[ItemResponse]:
+        """Create many items, committing every `chunk_size` rows."""
+        created = await self.repository.bulk_create(
+            items, chunk_size=chunk_size, on_commit=partial(self._changed, "created")
+        )
+        return [ItemResponse.model_validate(item) for item in created]
+
+    async def bulk_update_items(
+        self,
+        items: list[ItemBulkUpdate],
+        chunk_size: int = settings.BULK_CHUNK_SIZE,
+    ) -> list[ItemResponse]:
+        """Update many items, committing every `chunk_size` rows."""
+        updated = await self.repository.bulk_update(
+            items, chunk_size=chunk_size, on_commit=partial(self._changed, "updated")
+        )
+        return [ItemResponse.model_validate(item) for item in updated]
+
+    async def bulk_delete_items(
+        self, item_ids: list[int], chunk_size: int = settings.BULK_CHUNK_SIZE
+    ) -> int:
+        """Delete many items, committing every `chunk_size` rows."""
+        return await self.repository.bulk_delete(
+            item_ids, chunk_size=chunk_size, on_commit=partial(self._changed, "deleted")
+        )
+
+    def export_items(
+        self,
+        export_format: ExportFormat = "ndjson",
+        active_only: bool = True,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Stream every item encoded as NDJSON or CSV, optionally gzipped."""
+        batches = self.repository.stream_all(active_only=active_only)
+        if export_format == "csv":
+            chunks = encode_csv(batches, [column.key for column in ITEM_COLUMNS])
+        else:
+            chunks = encode_ndjson(batches)
+        return gzip_stream(chunks) if compress else chunks
+
+    async def get_item_count(
+        self, active_only: bool = True, approximate: bool = False
+    ) -> int:
         """Get total item count."""
-        return await self.repository.count(active_only=active_only)
+        return await self.repository.count(
+            active_only=active_only, approximate=approximate
+        )
@@ -0,0 +1,62 @@
+"""
+Encoders for streaming item exports.
+"""
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Literal
+
+from sqlalchemy import Row
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+async def encode_ndjson(batches: AsyncIterator[Sequence[Row]]) -> AsyncIterator[bytes]:
+    """Encode each row as one JSON object per line."""
+    async for batch in batches:
+        lines = [json.dumps(row._asdict(), default=_json_default) for row in batch]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def encode_csv(
+    batches: AsyncIterator[Sequence[Row]], columns: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """Encode rows as CSV with a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for batch in batches:
+        writer.writerows(
+            [v.isoformat() if isinstance(v, datetime) else v for v in row]
+            for row in batch
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only: the table had no matching rows
+        yield buffer.getvalue().encode()
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a byte stream on the fly."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,9 @@
+"""
+File storage backends package.
+"""
+
+from app.storage.base import StorageBackend, StoredFile
+from app.storage.local import LocalStorage
+from app.storage.s3 import S3Storage
+
+__all__ = ["StorageBackend", "StoredFile", "LocalStorage", "S3Storage"]
@@ -0,0 +1,69 @@
+"""
+Storage backend interface for uploaded files.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """Where an upload was written, with the size and hash seen while writing."""
+
+    key: str
+    size: int
+    sha256: str
+
+
+class StorageBackend(ABC):
+    """
+    Base class for file storage backends.
+
+    Subclasses implement `_write`, consuming chunks as they arrive; `save`
+    wraps them to compute the size and SHA-256 in the same pass.
+    """
+
+    chunk_size = 64 * 1024
+
+    async def save(
+        self, key: str, chunks: AsyncIterator[bytes], max_size: int | None = None
+    ) -> StoredFile:
+        """
+        Stream chunks to `key`, hashing them on the way through.
+
+        Raises:
+            ValueError: If the stream grows beyond `max_size` bytes. Nothing is
+                left behind at `key` in that case.
+        """
+        digest = hashlib.sha256()
+        size = 0
+
+        async def measured() -> AsyncIterator[bytes]:
+            nonlocal size
+            async for chunk in chunks:
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise ValueError(
+                        f"파일 크기는 최대 {max_size / (1024 * 1024):.1f}MB여야 합니다"
+                    )
+                digest.update(chunk)
+                yield chunk
+
+        await self._write(key, measured())
+        return StoredFile(key=key, size=size, sha256=digest.hexdigest())
+
+    @abstractmethod
+    async def _write(self, key: str, chunks: AsyncIterator[bytes]) -> None:
+        """Write chunks to `key`, removing any partial object on failure."""
+
+    @abstractmethod
+    def read(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """Stream the bytes of `key` in `[start, end)`; `end=None` reads to EOF."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete the object at `key` if it exists."""
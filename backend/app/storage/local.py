@@ -0,0 +1,57 @@
+"""
+Local filesystem storage backend.
+"""
+
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import uuid4
+
+import anyio
+
+from app.storage.base import StorageBackend
+
+
+class LocalStorage(StorageBackend):
+    """Stores files under a root directory on local disk."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        """Resolve a key to its path, refusing keys that escape the root."""
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    async def _write(self, key: str, chunks: AsyncIterator[bytes]) -> None:
+        path = self.path(key)
+        # Unique per write: concurrent saves of one key must not share it
+        partial = path.with_name(f"{path.name}.{uuid4().hex}.part")
+        await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+        try:
+            async with await anyio.open_file(partial, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+            # Readers never see a half-written file
+            os.replace(partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+    async def read(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        async with await anyio.open_file(self.path(key), "rb") as f:
+            await f.seek(start)
+            remaining = float("inf") if end is None else end - start
+            while remaining > 0:
+                chunk = await f.read(int(min(self.chunk_size, remaining)))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    async def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
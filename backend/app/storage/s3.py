@@ -0,0 +1,123 @@
+"""
+S3-compatible storage backend (AWS S3, MinIO, ...).
+
+Requires the optional `boto3` dependency.
+"""
+
+from collections.abc import AsyncIterator
+
+from starlette.concurrency import run_in_threadpool
+
+from app.storage.base import StorageBackend
+
+# S3 rejects multipart parts smaller than 5 MiB (except the last one)
+PART_SIZE = 8 * 1024 * 1024
+
+
+class S3Storage(StorageBackend):
+    """
+    Stores files in an S3 bucket.
+
+    Uploads are sent as multipart uploads, so at most one part is held in
+    memory at a time; objects smaller than one part use a single PUT.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+    ):
+        try:
+            import boto3
+        except ImportError as e:  # pragma: no cover - depends on environment
+            raise RuntimeError("S3 storage requires the 'boto3' package") from e
+
+        self.bucket = bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key or None,
+            aws_secret_access_key=secret_key or None,
+        )
+
+    async def _write(self, key: str, chunks: AsyncIterator[bytes]) -> None:
+        buffer = bytearray()
+        upload_id = None
+        parts: list[dict] = []
+
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                if len(buffer) >= PART_SIZE:
+                    if upload_id is None:
+                        response = await run_in_threadpool(
+                            self.client.create_multipart_upload,
+                            Bucket=self.bucket,
+                            Key=key,
+                        )
+                        upload_id = response["UploadId"]
+                    parts.append(await self._upload_part(key, upload_id, parts, buffer))
+                    buffer = bytearray()
+
+            if upload_id is None:
+                await run_in_threadpool(
+                    self.client.put_object,
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=bytes(buffer),
+                )
+                return
+
+            if buffer:
+                parts.append(await self._upload_part(key, upload_id, parts, buffer))
+            await run_in_threadpool(
+                self.client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            if upload_id is not None:
+                await run_in_threadpool(
+                    self.client.abort_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            raise
+
+    async def _upload_part(
+        self, key: str, upload_id: str, parts: list[dict], data: bytearray
+    ) -> dict:
+        number = len(parts) + 1
+        response = await run_in_threadpool(
+            self.client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=bytes(data),
+        )
+        return {"ETag": response["ETag"], "PartNumber": number}
+
+    async def read(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        byte_range = f"bytes={start}-" + ("" if end is None else str(end - 1))
+        response = await run_in_threadpool(
+            self.client.get_object, Bucket=self.bucket, Key=key, Range=byte_range
+        )
+        body = response["Body"]
+        try:
+            while chunk := await run_in_threadpool(body.read, self.chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def delete(self, key: str) -> None:
+        await run_in_threadpool(self.client.delete_object, Bucket=self.bucket, Key=key)
@@ -0,0 +1,3 @@
+"""
+Load and performance benchmarks, run outside the test suite.
+"""
@@ -0,0 +1,348 @@
+"""
+Load-testing harness for the items API.
+
+Starts the app under uvicorn against a scratch database, seeds it through
+the API, then drives each scenario with concurrent httpx clients and
+reports throughput, latency percentiles and error rate:
+
+    python -m bench.load --duration 10 --concurrency 16 --output run.json
+    python -m bench.load --database-url postgresql://... --scenario read
+    python -m bench.load --baseline before.json
+
+Runs are reproducible for a given --seed, apart from timing. Point
+--database-url at a scratch database: seeding adds rows every run.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from bench.scenarios import SCENARIOS, BenchState, Scenario
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class ScenarioResult:
+    """Latencies and failures of one scenario run."""
+
+    name: str
+    seconds: float = 0.0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.errors
+
+    def summary(self) -> dict[str, float]:
+        """Throughput, latency percentiles in ms and error rate."""
+        latencies = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "throughput_rps": round(self.requests / self.seconds, 1)
+            if self.seconds
+            else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "error_rate": round(self.errors / self.requests, 4)
+            if self.requests
+            else 0.0,
+        }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values; 0 for none."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    scenario: Scenario,
+    state: BenchState,
+    duration: float,
+    concurrency: int,
+    seed: int,
+    max_requests: int | None = None,
+) -> ScenarioResult:
+    """
+    Run `scenario` from `concurrency` workers for `duration` seconds.
+
+    Stops early after `max_requests` requests. Responses with status 400
+    and above, and transport errors, count as errors; only successful
+    requests contribute latencies.
+    """
+    result = ScenarioResult(name)
+    deadline = time.perf_counter() + duration
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline and (
+            max_requests is None or result.requests < max_requests
+        ):
+            start = time.perf_counter()
+            try:
+                response = await scenario(client, rng, state)
+            except httpx.HTTPError:
+                result.errors += 1
+                continue
+            if response.status_code >= 400:
+                result.errors += 1
+            else:
+                result.latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+async def seed_items(client: httpx.AsyncClient, count: int) -> list[int]:
+    """Create `count` items through the bulk endpoint; returns their IDs."""
+    ids = []
+    for offset in range(0, count, 1000):
+        batch = [
+            {"title": f"Seed {i}", "description": f"Seeded item {i}"}
+            for i in range(offset, min(offset + 1000, count))
+        ]
+        response = await client.post("/api/items/bulk", json=batch)
+        response.raise_for_status()
+        ids.extend(item["id"] for item in response.json())
+    return ids
+
+
+async def run(
+    client: httpx.AsyncClient,
+    scenarios: list[str],
+    duration: float,
+    concurrency: int,
+    seed: int,
+    items: int,
+    upload_size: int,
+    max_requests: int | None = None,
+) -> dict[str, dict[str, float]]:
+    """Seed the app behind `client`, then run each scenario in turn."""
+    state = BenchState(
+        item_ids=await seed_items(client, items), upload_size=upload_size
+    )
+    summaries = {}
+    for name in scenarios:
+        result = await run_scenario(
+            client,
+            name,
+            SCENARIOS[name],
+            state,
+            duration,
+            concurrency,
+            seed,
+            max_requests,
+        )
+        summaries[name] = result.summary()
+    return summaries
+
+
+async def prepare_database(database_url: str) -> None:
+    """Create the schema if it does not exist yet."""
+    import app.models  # noqa: F401 - registers the tables
+    from app.core.database import Base, create_engine
+
+    engine = create_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def serve(database_url: str, workers: int, scratch: Path) -> Iterator[str]:
+    """Run the app under uvicorn until exit; yields its base URL."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DATABASE_REPLICA_URLS": "[]",
+        "STORAGE_BACKEND": "local",
+        "STORAGE_LOCAL_ROOT": str(scratch / "uploads"),
+        "STATIC_WATCH": "false",
+        "DEBUG": "false",
+    }
+    if workers > 1:
+        (scratch / "metrics").mkdir(exist_ok=True)
+        env["PROMETHEUS_MULTIPROC_DIR"] = str(scratch / "metrics")
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_until_live(base_url, server)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def _wait_until_live(base_url: str, server: subprocess.Popen, timeout=30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        with contextlib.suppress(httpx.HTTPError):
+            if httpx.get(f"{base_url}/api/health/live").status_code == 200:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f"App did not start within {timeout:.0f}s")
+
+
+def compare(
+    current: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]
+) -> list[str]:
+    """Lines comparing throughput and p95 of scenarios present in both runs."""
+    lines = []
+    for name, result in current.items():
+        before = baseline.get(name)
+        if not before or not before["throughput_rps"] or not before["p95_ms"]:
+            continue
+        throughput = result["throughput_rps"] / before["throughput_rps"] - 1
+        p95 = result["p95_ms"] / before["p95_ms"] - 1
+        lines.append(
+            f"{name:>8}  throughput {throughput:+.1%}  p95 {p95:+.1%}"
+            f"  errors {before['error_rate']:.2%} -> {result['error_rate']:.2%}"
+        )
+    return lines
+
+
+def _git_commit() -> str | None:
+    with contextlib.suppress(OSError, subprocess.CalledProcessError):
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    return None
+
+
+def _print_table(results: dict[str, dict[str, float]]) -> None:
+    columns = ["requests", "throughput_rps", "p50_ms", "p95_ms", "p99_ms", "error_rate"]
+    print(f"{'scenario':>8}" + "".join(f"{column:>16}" for column in columns))
+    for name, result in results.items():
+        print(f"{name:>8}" + "".join(f"{result[column]:>16}" for column in columns))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run; repeat for several (default: all)",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds each")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--items", type=int, default=1000, help="Items to seed")
+    parser.add_argument("--upload-size", type=int, default=64 * 1024)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        help="Database to test against (default: a fresh SQLite file)",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON here")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON to compare with")
+    args = parser.parse_args(argv)
+    scenarios = args.scenario or list(SCENARIOS)
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as scratch:
+        scratch = Path(scratch)
+        database_url = (
+            args.database_url or f"sqlite+aiosqlite:///{scratch / 'bench.db'}"
+        )
+        asyncio.run(prepare_database(database_url))
+        with serve(database_url, args.workers, scratch) as base_url:
+
+            async def drive() -> dict[str, dict[str, float]]:
+                limits = httpx.Limits(max_connections=args.concurrency)
+                async with httpx.AsyncClient(
+                    base_url=base_url, timeout=30.0, limits=limits
+                ) as client:
+                    return await run(
+                        client,
+                        scenarios,
+                        args.duration,
+                        args.concurrency,
+                        args.seed,
+                        args.items,
+                        args.upload_size,
+                    )
+
+            results = asyncio.run(drive())
+
+    _print_table(results)
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["scenarios"]
+        print("\nvs", args.baseline)
+        print("\n".join(compare(results, baseline)))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "commit": _git_commit(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "database": database_url.split(":", 1)[0],
+            "config": {
+                key: value
+                for key, value in vars(args).items()
+                if key not in ("scenario", "output", "baseline", "database_url")
+            }
+            | {"scenarios": scenarios},
+            "scenarios": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print("\nSaved", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Load-test scenarios: each call issues one request against the items API.
+"""
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from httpx import AsyncClient, Response
+
+
+@dataclass
+class BenchState:
+    """IDs known to exist and list cursors, shared by a scenario's workers."""
+
+    item_ids: list[int] = field(default_factory=list)
+    cursors: list[str] = field(default_factory=list)
+    upload_size: int = 64 * 1024
+
+    def pick_id(self, rng: random.Random) -> int:
+        return rng.choice(self.item_ids) if self.item_ids else 1
+
+
+Scenario = Callable[[AsyncClient, random.Random, BenchState], Awaitable[Response]]
+
+SORTS = ["-created_at", "created_at", "title", "-updated_at", "id"]
+
+
+async def read_item(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """GET one existing item."""
+    return await client.get(f"/api/items/{state.pick_id(rng)}")
+
+
+async def list_items(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """GET a page of items, continuing a previous page's cursor half the time."""
+    if state.cursors and rng.random() < 0.5:
+        cursor = state.cursors.pop(rng.randrange(len(state.cursors)))
+        sort, _, cursor = cursor.partition(" ")
+        params = {"sort": sort, "cursor": cursor, "limit": 50}
+    else:
+        params = {"sort": rng.choice(SORTS), "limit": 50}
+    response = await client.get("/api/items", params=params)
+    if next_cursor := response.headers.get("x-next-cursor"):
+        state.cursors.append(f"{params['sort']} {next_cursor}")
+        del state.cursors[:-100]
+    return response
+
+
+async def create_item(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """POST a new item."""
+    response = await client.post(
+        "/api/items",
+        json={"title": f"Bench {rng.getrandbits(32):08x}", "description": "load"},
+    )
+    if response.status_code == 201:
+        state.item_ids.append(response.json()["id"])
+    return response
+
+
+async def update_item(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """PUT a new title on an existing item."""
+    return await client.put(
+        f"/api/items/{state.pick_id(rng)}",
+        json={"title": f"Updated {rng.getrandbits(32):08x}"},
+    )
+
+
+async def delete_item(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """DELETE an item created by the benchmark, or read one if none is left."""
+    if len(state.item_ids) < 2:
+        return await read_item(client, rng, state)
+    item_id = state.item_ids.pop(rng.randrange(len(state.item_ids)))
+    return await client.delete(f"/api/items/{item_id}")
+
+
+# Weights of the mixed CRUD scenario, roughly a typical read/write ratio
+CRUD_MIX: list[tuple[Scenario, int]] = [
+    (read_item, 50),
+    (list_items, 20),
+    (create_item, 15),
+    (update_item, 10),
+    (delete_item, 5),
+]
+
+
+async def mixed_crud(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """One request drawn from CRUD_MIX."""
+    scenarios, weights = zip(*CRUD_MIX, strict=True)
+    scenario = rng.choices(scenarios, weights=weights)[0]
+    return await scenario(client, rng, state)
+
+
+async def upload_files(
+    client: AsyncClient, rng: random.Random, state: BenchState
+) -> Response:
+    """POST an item with three files of random content."""
+    files = [
+        ("files", (f"page{i}.txt", rng.randbytes(state.upload_size), "text/plain"))
+        for i in range(3)
+    ]
+    return await client.post(
+        "/api/items/with-multiple-files", data={"title": "Bench upload"}, files=files
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "read": read_item,
+    "list": list_items,
+    "crud": mixed_crud,
+    "upload": upload_files,
+}
@@ -3,14 +3,22 @@ Pytest configuration and fixtures.
 """
 import asyncio
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.database import Base, get_db
+from app.core.cache import get_item_cache
+from app.core.config import settings
+from app.core.database import Base, get_autocommit_db, get_db
+from app.core.instrumentation import capture_sql
+from app.core.storage import get_storage
 from app.main import app
+from app.repositories.item import count_cache
+from app.storage import LocalStorage
 
 
 @pytest.fixture(scope="session")
@@ -21,6 +29,23 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+async def clear_caches():
+    """Keep in-process caches from leaking between tests."""
+    count_cache.clear()
+    await get_item_cache().clear()
+    yield
+    count_cache.clear()
+    await get_item_cache().clear()
+
+
+@pytest.fixture
+def item_cache(monkeypatch):
+    """Turn on the in-process item cache, which is off by default."""
+    monkeypatch.setattr(settings, "ITEM_CACHE_ENABLED", True)
+    return get_item_cache()
+
+
 @pytest.fixture
 async def test_engine():
     """Create test database engine using SQLite."""
@@ -31,6 +56,11 @@ async def test_engine():
     database_url = f"sqlite+aiosqlite:///{temp_db.name}"
     engine = create_async_engine(database_url, echo=False)
 
+    # Enforce ON DELETE CASCADE like PostgreSQL does
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -54,16 +84,45 @@ async def db_session(test_engine):
 
 
 @pytest.fixture
-async def client(db_session: AsyncSession):
-    """Create a test client with database session override."""
+def storage(tmp_path):
+    """Create a local storage backend in a temporary directory."""
+    return LocalStorage(tmp_path / "uploads")
+
+
+@pytest.fixture
+async def client(db_session: AsyncSession, storage: LocalStorage):
+    """Create a test client with database session and storage overrides."""
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_autocommit_db] = override_get_db
+    app.dependency_overrides[get_storage] = lambda: storage
 
     try:
         async with AsyncClient(app=app, base_url="http://test") as ac:
             yield ac
     finally:
         app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def sql_budget():
+    """
+    Assert a block runs at most `max_statements` SQL statements.
+
+        with sql_budget(2):
+            await client.get("/api/items")
+    """
+
+    @contextmanager
+    def budget(max_statements: int):
+        with capture_sql() as stats:
+            yield stats
+        assert stats.statements <= max_statements, (
+            f"{stats.statements} statements, budget {max_statements}:\n"
+            + "\n".join(f"{n}x {shape}" for shape, n in stats.shapes.items())
+        )
+
+    return budget
@@ -3,6 +3,20 @@ Tests for health check endpoints.
 """
 import pytest
 
+from app.api import health
+from app.core.database import create_engine
+from app.core.health import HealthProber
+
+
+@pytest.fixture
+async def prober(tmp_path, monkeypatch):
+    """A prober on a metered SQLite engine, serving the health endpoints."""
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'health.db'}")
+    prober = HealthProber(engine, interval=5.0, timeout=1.0, max_pool_wait=0.1)
+    monkeypatch.setattr(health, "health_prober", prober)
+    yield prober
+    await engine.dispose()
+
 
 @pytest.mark.asyncio
 async def test_health_check(client):
@@ -22,3 +36,82 @@ async def test_database_health_check(client):
     data = response.json()
     assert data["status"] == "healthy"
     assert data["database"] == "connected"
+
+
+@pytest.mark.asyncio
+async def test_database_pool_metrics(client):
+    """Test pool metrics are reported without opening connections."""
+    response = await client.get("/api/health/db/pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["checked_out"] == 0
+    assert {"size", "overflow", "checkouts", "checkout_timeouts"} <= set(data)
+
+
+@pytest.mark.asyncio
+async def test_liveness_check(client):
+    """Test liveness needs nothing but a running process."""
+    response = await client.get("/api/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+@pytest.mark.asyncio
+async def test_readiness_follows_probes(client, prober):
+    """Test readiness is served from the latest probe, not a query per call."""
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json()["error"] == "not probed yet"
+
+    await prober.probe()
+    checkouts = prober.engine.pool.stats.checkouts
+    for _ in range(3):
+        response = await client.get("/api/health/ready")
+        assert response.status_code == 200
+    assert prober.engine.pool.stats.checkouts == checkouts
+
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["database"] is True
+    assert data["latency_seconds"] > 0
+    assert data["age_seconds"] < 5
+
+
+@pytest.mark.asyncio
+async def test_readiness_fails_on_slow_pool_checkouts(client, prober):
+    """Test long waits for pooled connections flip readiness until they ease."""
+    prober.engine.pool.stats.record(0.5)
+    await prober.probe()
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json()["pool_wait_seconds"] >= 0.5
+
+    await prober.probe()
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_readiness_fails_when_database_is_down(client, tmp_path, monkeypatch):
+    """Test an unreachable database makes the pod unready."""
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'x.db'}")
+    prober = HealthProber(engine, timeout=1.0)
+    monkeypatch.setattr(health, "health_prober", prober)
+    try:
+        await prober.probe()
+    finally:
+        await engine.dispose()
+
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json()["database"] is False
+
+
+@pytest.mark.asyncio
+async def test_readiness_fails_when_probes_stop(client, prober):
+    """Test a stale result is not trusted."""
+    await prober.probe()
+    prober.state.checked_at -= 3 * prober.interval + 1
+
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
@@ -0,0 +1,260 @@
+"""
+Tests for the live item change feed.
+"""
+import asyncio
+
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.core.events import (
+    CHANNEL,
+    MAX_EVENT_IDS,
+    RESYNC,
+    EventBroadcaster,
+    PostgresBroadcaster,
+    get_item_events,
+)
+from app.main import app
+from app.services import item as item_service
+
+
+async def _next(subscription):
+    return await subscription.get(timeout=1.0)
+
+
+def _scope(scope_type: str, path: str) -> dict:
+    return {
+        "type": scope_type,
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "ws" if scope_type == "websocket" else "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+        "subprotocols": [],
+    }
+
+
+class ASGIConnection:
+    """Drives one long-lived request against the app in the test's loop."""
+
+    def __init__(self, scope: dict, first_message: dict, close_message: dict):
+        self.sent: asyncio.Queue[dict] = asyncio.Queue()
+        self.incoming: asyncio.Queue[dict] = asyncio.Queue()
+        self.incoming.put_nowait(first_message)
+        self.close_message = close_message
+        self.task = asyncio.create_task(app(scope, self.incoming.get, self.sent.put))
+
+    async def receive(self) -> dict:
+        return await asyncio.wait_for(self.sent.get(), timeout=2.0)
+
+    async def close(self) -> None:
+        self.incoming.put_nowait(self.close_message)
+        await asyncio.wait_for(self.task, timeout=2.0)
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_fans_out_to_every_subscriber():
+    """Each subscription gets every event until it unsubscribes."""
+    events = EventBroadcaster(max_queue=10)
+    async with events.subscribe() as first, events.subscribe() as second:
+        assert len(events) == 2
+        events.publish("created", 1, 2)
+        assert await _next(first) == {"type": "created", "ids": [1, 2]}
+        assert await _next(second) == {"type": "created", "ids": [1, 2]}
+    assert len(events) == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync_instead_of_backlog():
+    """A full queue collapses into one resync without affecting others."""
+    events = EventBroadcaster(max_queue=3)
+    async with events.subscribe() as slow, events.subscribe() as fast:
+        for item_id in range(3):
+            events.publish("updated", item_id)
+            assert await _next(fast) == {"type": "updated", "ids": [item_id]}
+        events.publish("deleted", 7)
+
+        assert await _next(fast) == {"type": "deleted", "ids": [7]}
+        assert await _next(slow) == RESYNC
+        assert slow.queue.empty()
+        assert slow.resyncs == 1
+
+        events.publish("created", 8)
+        assert await _next(slow) == {"type": "created", "ids": [8]}
+
+
+@pytest.mark.asyncio
+async def test_large_batches_omit_ids():
+    """Events about more than MAX_EVENT_IDS items carry no IDs."""
+    events = EventBroadcaster(max_queue=10)
+    async with events.subscribe() as subscription:
+        events.publish("deleted", *range(MAX_EVENT_IDS + 1))
+        assert await _next(subscription) == {"type": "deleted", "ids": None}
+
+
+@pytest.mark.asyncio
+async def test_subscription_get_times_out():
+    """An idle subscription returns None after the timeout, for keep-alives."""
+    async with EventBroadcaster(max_queue=1).subscribe() as subscription:
+        assert await subscription.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_writes_publish_item_events(client):
+    """Creates, updates and deletes through the API are announced."""
+    async with get_item_events().subscribe() as subscription:
+        response = await client.post("/api/items", json={"title": "Live"})
+        item_id = response.json()["id"]
+        assert await _next(subscription) == {"type": "created", "ids": [item_id]}
+
+        await client.put(f"/api/items/{item_id}", json={"title": "Edited"})
+        assert await _next(subscription) == {"type": "updated", "ids": [item_id]}
+
+        response = await client.post(
+            "/api/items/bulk", json=[{"title": "A"}, {"title": "B"}]
+        )
+        ids = [item["id"] for item in response.json()]
+        assert await _next(subscription) == {"type": "created", "ids": ids}
+
+        await client.request("DELETE", "/api/items/bulk", json={"ids": ids})
+        assert await _next(subscription) == {"type": "deleted", "ids": ids}
+
+        await client.delete(f"/api/items/{item_id}")
+        assert await _next(subscription) == {"type": "deleted", "ids": [item_id]}
+
+        # Nothing was deleted, so nothing is announced
+        await client.delete(f"/api/items/{item_id}")
+        assert await subscription.get(timeout=0.05) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_server_sent_events(client):
+    """GET /api/items/stream streams writes as named SSE events."""
+    stream = ASGIConnection(
+        _scope("http", "/api/items/stream"),
+        {"type": "http.request", "body": b"", "more_body": False},
+        {"type": "http.disconnect"},
+    )
+    start = await stream.receive()
+    headers = dict(start["headers"])
+    assert start["status"] == 200
+    assert headers[b"content-type"].startswith(b"text/event-stream")
+    assert headers[b"cache-control"] == b"no-cache"
+    assert (await stream.receive())["body"] == b": subscribed\n\n"
+
+    response = await client.post("/api/items", json={"title": "Streamed"})
+    item_id = response.json()["id"]
+    body = (await stream.receive())["body"]
+    name, data = body.decode().removesuffix("\n\n").split("\n")
+    assert name == "event: created"
+    assert orjson.loads(data.removeprefix("data: ")) == {
+        "type": "created",
+        "ids": [item_id],
+    }
+
+    await stream.close()
+    assert len(get_item_events()) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_keep_alives(monkeypatch):
+    """Idle streams get a comment every ITEM_EVENTS_HEARTBEAT seconds."""
+    monkeypatch.setattr(settings, "ITEM_EVENTS_HEARTBEAT", 0.01)
+    stream = ASGIConnection(
+        _scope("http", "/api/items/stream"),
+        {"type": "http.request", "body": b"", "more_body": False},
+        {"type": "http.disconnect"},
+    )
+    await stream.receive()
+    await stream.receive()
+    assert (await stream.receive())["body"] == b": keep-alive\n\n"
+    await stream.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_websocket_sends_json_events(client):
+    """The WebSocket variant sends each event as a JSON message."""
+    socket = ASGIConnection(
+        _scope("websocket", "/api/items/stream/ws"),
+        {"type": "websocket.connect"},
+        {"type": "websocket.disconnect", "code": 1000},
+    )
+    assert (await socket.receive())["type"] == "websocket.accept"
+    # Subscribed once accepted; let the endpoint reach its receive loop
+    while not len(get_item_events()):
+        await asyncio.sleep(0)
+
+    response = await client.post("/api/items", json={"title": "Socket"})
+    message = await socket.receive()
+    assert orjson.loads(message["text"]) == {
+        "type": "created",
+        "ids": [response.json()["id"]],
+    }
+
+    await socket.close()
+    assert len(get_item_events()) == 0
+
+
+@pytest.mark.asyncio
+async def test_postgres_broadcaster_dispatches_notifications():
+    """NOTIFY payloads fan out as-is; writers notify, so `publish` is a no-op."""
+    events = PostgresBroadcaster("postgresql+asyncpg://user:pw@db/app", max_queue=5)
+    assert events.url.drivername == "postgresql"
+    async with events.subscribe() as subscription:
+        events.publish("created", 1)
+        events._notify(None, 1, "item_changes", "not json")
+        events._notify(None, 1, "item_changes", '{"type": "updated", "ids": [4]}')
+        assert await _next(subscription) == {"type": "updated", "ids": [4]}
+        assert subscription.queue.empty()
+
+
+async def _bulk_writes(client) -> list[dict]:
+    """Bulk writes in chunks of two, returning the events they should cause."""
+    response = await client.post(
+        "/api/items/bulk?chunk_size=2", json=[{"title": t} for t in "ABC"]
+    )
+    ids = [item["id"] for item in response.json()]
+    await client.patch(
+        "/api/items/bulk?chunk_size=2",
+        json=[{"id": item_id, "is_active": False} for item_id in ids],
+    )
+    await client.request("DELETE", "/api/items/bulk?chunk_size=2", json={"ids": ids})
+    return [
+        {"type": event_type, "ids": chunk}
+        for event_type in ("created", "updated", "deleted")
+        for chunk in (ids[:2], ids[2:])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backends_send_one_event_per_bulk_chunk(client, db_session, monkeypatch):
+    """Both backends announce each committed chunk once, with the same event."""
+    async with get_item_events().subscribe() as subscription:
+        expected = await _bulk_writes(client)
+        assert [await _next(subscription) for _ in expected] == expected
+        assert subscription.queue.empty()
+
+    # SQLite stand-in for pg_notify, recording what PostgreSQL would deliver
+    notifications = []
+    connection = await (await db_session.connection()).get_raw_connection()
+    await connection.driver_connection.create_function(
+        "pg_notify", 2, lambda *notification: notifications.append(notification)
+    )
+    await db_session.commit()
+
+    events = PostgresBroadcaster("postgresql+asyncpg://user:pw@db/app", max_queue=10)
+    monkeypatch.setattr(item_service, "get_item_events", lambda: events)
+    async with events.subscribe() as subscription:
+        expected = await _bulk_writes(client)
+        assert {channel for channel, _ in notifications} == {CHANNEL}
+        for channel, payload in notifications:
+            events._notify(None, 1, channel, payload)
+        assert [await _next(subscription) for _ in expected] == expected
+        assert subscription.queue.empty()
@@ -1,7 +1,16 @@
 """
 Tests for items API endpoints.
 """
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
 import pytest
+from sqlalchemy import insert, update
+
+from app.models.item import Item
 
 
 @pytest.mark.asyncio
@@ -102,6 +111,180 @@ async def test_get_items_pagination(client):
     assert len(items) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_items_cursor_pagination(client, db_session):
+    """Test keyset pagination walks every item exactly once, including ties."""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    # Pairs of items share a timestamp so the id tie-breaker is exercised
+    db_session.add_all(
+        Item(title=f"Item {i}", created_at=base + timedelta(seconds=i // 2))
+        for i in range(7)
+    )
+    await db_session.commit()
+
+    seen = []
+    response = await client.get("/api/items?limit=3")
+    while True:
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        response = await client.get(f"/api/items?limit=3&cursor={cursor}")
+
+    response = await client.get("/api/items?limit=100")
+    assert seen == [item["id"] for item in response.json()]
+    assert len(seen) == 7
+
+
+@pytest.mark.asyncio
+async def test_get_items_invalid_cursor(client):
+    """Test malformed cursors and skip/cursor combinations are rejected."""
+    response = await client.get("/api/items?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    response = await client.get("/api/items?skip=1&cursor=abc")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_items_filter_and_sort(client, db_session):
+    """Test title prefix, date range and is_active filters with their sorts."""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    db_session.add_all(
+        [
+            Item(title="Beta", created_at=base, updated_at=base),
+            Item(title="Alpha 2", created_at=base + timedelta(days=1), updated_at=base),
+            Item(title="Alpha 1", created_at=base + timedelta(days=2), updated_at=base),
+            Item(title="Alpha 3", is_active=False, created_at=base, updated_at=base),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/items?title_prefix=Alpha&sort=title")
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Alpha 1", "Alpha 2"]
+
+    response = await client.get(
+        "/api/items",
+        params={
+            "created_after": (base + timedelta(days=1)).isoformat(),
+            "sort": "created_at",
+        },
+    )
+    assert [item["title"] for item in response.json()] == ["Alpha 2", "Alpha 1"]
+
+    response = await client.get("/api/items?is_active=false&sort=-id")
+    assert [item["title"] for item in response.json()] == ["Alpha 3"]
+
+
+@pytest.mark.asyncio
+async def test_get_items_sort_cursor_pagination(client):
+    """Test keyset pagination follows non-default sorts."""
+    await client.post(
+        "/api/items/bulk", json=[{"title": f"Item {i}"} for i in (3, 1, 4, 0, 2)]
+    )
+
+    titles = []
+    params = {"sort": "title", "limit": 2}
+    while True:
+        response = await client.get("/api/items", params=params)
+        titles.extend(item["title"] for item in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert titles == [f"Item {i}" for i in range(5)]
+
+    # Cursors are tied to the sort they were issued for
+    response = await client.get(
+        "/api/items", params={"sort": "-id", "cursor": params["cursor"]}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_items_sparse_fields(client, db_session):
+    """Test fields= limits the keys of every listed item."""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    db_session.add_all(
+        Item(title=f"Item {i}", description="Long text", created_at=base)
+        for i in range(3)
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/items?fields=title,is_active&limit=2")
+    assert response.status_code == 200
+    items = response.json()
+    assert [set(item) for item in items] == [{"id", "title", "is_active"}] * 2
+
+    # The sort column is only used for the cursor
+    response = await client.get(
+        "/api/items",
+        params={
+            "fields": "title",
+            "limit": 2,
+            "cursor": response.headers["X-Next-Cursor"],
+        },
+    )
+    assert [set(item) for item in response.json()] == [{"id", "title"}]
+
+    response = await client.get("/api/items?fields=title,secret")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_item_sparse_fields(client):
+    """Test fields= limits the keys of a single item."""
+    response = await client.post(
+        "/api/items", json={"title": "Item", "description": "Long text"}
+    )
+    item_id = response.json()["id"]
+
+    response = await client.get(f"/api/items/{item_id}?fields=title")
+    assert response.status_code == 200
+    assert response.json() == {"id": item_id, "title": "Item"}
+
+    response = await client.get("/api/items/999?fields=title")
+    assert response.status_code == 404
+
+    response = await client.get(f"/api/items/{item_id}?fields=secret")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_items_title_prefix_bounds(client, db_session):
+    """Test title_prefix matches exactly the titles starting with it."""
+    titles = ["Alp", "Alpha", "Alpha \U0010ffff", "Alphb", "alpha", "Alpha z"]
+    db_session.add_all([Item(title=title) for title in titles])
+    await db_session.commit()
+
+    response = await client.get("/api/items?title_prefix=Alpha&sort=title")
+    assert [item["title"] for item in response.json()] == [
+        "Alpha",
+        "Alpha z",
+        "Alpha \U0010ffff",
+    ]
+    response = await client.get("/api/items?title_prefix=Alpha&sort=-title&limit=1")
+    assert [item["title"] for item in response.json()] == ["Alpha \U0010ffff"]
+
+
+@pytest.mark.asyncio
+async def test_get_items_rejects_unindexed_combinations(client):
+    """Test range filters off the sort column are rejected."""
+    response = await client.get("/api/items?title_prefix=A")
+    assert response.status_code == 400
+    assert "sorting by title" in response.json()["detail"]
+
+    response = await client.get(
+        "/api/items?updated_after=2024-01-01T00:00:00&sort=-created_at"
+    )
+    assert response.status_code == 400
+
+    response = await client.get("/api/items?sort=name")
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_get_item_by_id(client):
     """Test getting a specific item by ID."""
@@ -198,3 +381,436 @@ async def test_get_item_count(client):
     response = await client.get("/api/items/count?active_only=false")
     assert response.status_code == 200
     assert response.json()["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_item_count_cached(client, db_session):
+    """Test counts are cached until a write goes through the API."""
+    await client.post("/api/items", json={"title": "Item 1"})
+    response = await client.get("/api/items/count")
+    assert response.json()["count"] == 1
+
+    # A write that bypasses the repository is not seen until invalidation
+    await db_session.execute(insert(Item).values(title="Out of band"))
+    await db_session.commit()
+    response = await client.get("/api/items/count")
+    assert response.json()["count"] == 1
+
+    await client.post("/api/items", json={"title": "Item 2"})
+    response = await client.get("/api/items/count")
+    assert response.json()["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_item_count_approximate(client):
+    """Test approximate counts fall back to exact counts outside PostgreSQL."""
+    await client.post("/api/items", json={"title": "Item 1"})
+    await client.post("/api/items", json={"title": "Item 2", "is_active": False})
+
+    response = await client.get("/api/items/count?approximate=true")
+    assert response.status_code == 200
+    assert response.json()["count"] == 1
+
+    response = await client.get("/api/items/count?approximate=true&active_only=false")
+    assert response.json()["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_items(client):
+    """Test creating items in chunks returns them in request order."""
+    items_data = [{"title": f"Item {i}"} for i in range(5)]
+    items_data[1]["description"] = "Second"
+
+    response = await client.post("/api/items/bulk?chunk_size=2", json=items_data)
+    assert response.status_code == 201
+    data = response.json()
+    assert [item["title"] for item in data] == [f"Item {i}" for i in range(5)]
+    assert data[1]["description"] == "Second"
+
+    response = await client.get("/api/items/count")
+    assert response.json()["count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_items(client):
+    """Test updating items in bulk skips unknown IDs."""
+    response = await client.post(
+        "/api/items/bulk", json=[{"title": "A"}, {"title": "B"}, {"title": "C"}]
+    )
+    a, b, c = response.json()
+
+    response = await client.patch(
+        "/api/items/bulk?chunk_size=2",
+        json=[
+            {"id": a["id"], "title": "A2"},
+            {"id": b["id"], "is_active": False},
+            {"id": 999, "title": "Missing"},
+            {"id": c["id"], "title": "C2", "description": "Updated"},
+        ],
+    )
+    assert response.status_code == 200
+    data = {item["id"]: item for item in response.json()}
+    assert set(data) == {a["id"], b["id"], c["id"]}
+    assert data[a["id"]]["title"] == "A2"
+    assert data[b["id"]]["title"] == "B"
+    assert data[b["id"]]["is_active"] is False
+    assert data[c["id"]]["description"] == "Updated"
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_items(client):
+    """Test deleting items in bulk reports how many rows were removed."""
+    response = await client.post(
+        "/api/items/bulk", json=[{"title": f"Item {i}"} for i in range(4)]
+    )
+    ids = [item["id"] for item in response.json()]
+
+    response = await client.request(
+        "DELETE", "/api/items/bulk?chunk_size=2", json={"ids": ids[:3] + [999]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 3}
+
+    response = await client.get("/api/items/count")
+    assert response.json()["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_export_items_ndjson(client):
+    """Test exporting active items as NDJSON."""
+    await client.post(
+        "/api/items/bulk",
+        json=[{"title": "Item 1"}, {"title": "Item 2", "is_active": False}],
+    )
+
+    response = await client.get("/api/items/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in rows] == ["Item 1"]
+
+    response = await client.get("/api/items/export?active_only=false")
+    assert len(response.text.splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_export_items_csv_gzip(client):
+    """Test exporting items as gzipped CSV."""
+    await client.post("/api/items/bulk", json=[{"title": "Item, quoted"}])
+
+    response = await client.get("/api/items/export?format=csv&gzip=true")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode())))
+    assert rows[0] == [
+        "id",
+        "title",
+        "description",
+        "is_active",
+        "created_at",
+        "updated_at",
+        "version",
+    ]
+    assert rows[1][1] == "Item, quoted"
+
+    response = await client.get("/api/items/export?format=xml")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_item_read_through_cache(client, db_session, item_cache):
+    """Test single items are cached and invalidated by API writes."""
+    response = await client.post("/api/items", json={"title": "Cached"})
+    item_id = response.json()["id"]
+
+    before = (await client.get("/api/health/cache")).json()
+    await client.get(f"/api/items/{item_id}")
+    await client.get(f"/api/items/{item_id}")
+    after = (await client.get("/api/health/cache")).json()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+    # Out-of-band writes are hidden by the cache until an API write
+    await db_session.execute(
+        update(Item).where(Item.id == item_id).values(title="Out of band")
+    )
+    await db_session.commit()
+    response = await client.get(f"/api/items/{item_id}")
+    assert response.json()["title"] == "Cached"
+
+    await client.put(f"/api/items/{item_id}", json={"description": "Updated"})
+    response = await client.get(f"/api/items/{item_id}")
+    assert response.json()["title"] == "Out of band"
+    assert response.json()["description"] == "Updated"
+
+    await client.delete(f"/api/items/{item_id}")
+    response = await client.get(f"/api/items/{item_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_items_cache_invalidated_on_write(client, item_cache):
+    """Test cached list pages are dropped when any item changes."""
+    await client.post("/api/items", json={"title": "Item 1"})
+    response = await client.get("/api/items")
+    assert len(response.json()) == 1
+
+    await client.post("/api/items/bulk", json=[{"title": "Item 2"}])
+    response = await client.get("/api/items")
+    assert len(response.json()) == 2
+
+    item_id = response.json()[0]["id"]
+    await client.put(f"/api/items/{item_id}", json={"is_active": False})
+    response = await client.get("/api/items")
+    assert item_id not in [item["id"] for item in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_search_items(client):
+    """Test search matches title and description, ranking title hits first."""
+    await client.post(
+        "/api/items/bulk",
+        json=[
+            {"title": "Blue widget", "description": "Small"},
+            {"title": "Gadget", "description": "Pairs with a widget"},
+            {"title": "Sprocket", "description": "Unrelated"},
+            {"title": "Hidden widget", "is_active": False},
+        ],
+    )
+
+    response = await client.get("/api/items/search", params={"q": "widget"})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Blue widget", "Gadget"]
+
+    # Prefix matching on partial words
+    response = await client.get("/api/items/search", params={"q": "sprock"})
+    assert [item["title"] for item in response.json()] == ["Sprocket"]
+
+    response = await client.get(
+        "/api/items/search", params={"q": "widget", "active_only": False}
+    )
+    assert len(response.json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_items_follows_writes(client):
+    """Test the search index tracks updates and deletes."""
+    response = await client.post("/api/items", json={"title": "Old name"})
+    item_id = response.json()["id"]
+
+    await client.put(f"/api/items/{item_id}", json={"title": "New name"})
+    response = await client.get("/api/items/search", params={"q": "old"})
+    assert response.json() == []
+    response = await client.get("/api/items/search", params={"q": "new"})
+    assert [item["id"] for item in response.json()] == [item_id]
+
+    await client.delete(f"/api/items/{item_id}")
+    response = await client.get("/api/items/search", params={"q": "new"})
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_search_items_cursor_pagination(client):
+    """Test search results page by cursor without gaps or repeats."""
+    await client.post(
+        "/api/items/bulk", json=[{"title": f"Report {i}"} for i in range(5)]
+    )
+
+    seen = []
+    params = {"q": "report", "limit": 2}
+    while True:
+        response = await client.get("/api/items/search", params=params)
+        seen.extend(item["id"] for item in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert sorted(seen) == sorted(set(seen))
+    assert len(seen) == 5
+
+
+@pytest.mark.asyncio
+async def test_search_items_invalid_request(client):
+    """Test empty queries and malformed cursors are rejected."""
+    response = await client.get("/api/items/search", params={"q": ""})
+    assert response.status_code == 422
+
+    response = await client.get(
+        "/api/items/search", params={"q": "x", "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_item_conditional(client):
+    """Test item ETag/Last-Modified revalidation and invalidation by updates."""
+    response = await client.post("/api/items", json={"title": "Polled"})
+    item_id = response.json()["id"]
+
+    response = await client.get(f"/api/items/{item_id}")
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = await client.get(
+        f"/api/items/{item_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = await client.get(
+        f"/api/items/{item_id}", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    # Each sparse fieldset has its own weak tag, whatever the field order
+    response = await client.get(
+        f"/api/items/{item_id}?fields=title", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    partial_etag = response.headers["etag"]
+    assert partial_etag.startswith("W/") and partial_etag != f"W/{etag}"
+
+    response = await client.get(
+        f"/api/items/{item_id}?fields=is_active,title",
+        headers={"If-None-Match": partial_etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != partial_etag
+
+    response = await client.get(
+        f"/api/items/{item_id}?fields=title,is_active",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+    # Unknown fields are rejected before revalidation
+    response = await client.get(
+        f"/api/items/{item_id}?fields=bogus", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 400
+
+    await client.put(f"/api/items/{item_id}", json={"title": "Changed"})
+    response = await client.get(
+        f"/api/items/{item_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_item_conditional_not_found(client):
+    """Test revalidating a missing item is a 404, not a 304."""
+    response = await client.get("/api/items/999", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_items_conditional(client):
+    """Test list pages revalidate until an item in the list changes."""
+    response = await client.post("/api/items", json={"title": "Item 1"})
+    item_id = response.json()["id"]
+
+    response = await client.get("/api/items")
+    etag = response.headers["etag"]
+    assert etag.startswith("W/")
+
+    response = await client.get("/api/items", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Queries returning something else have their own tags
+    response = await client.get(
+        "/api/items?fields=title", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+    await client.delete(f"/api/items/{item_id}")
+    response = await client.get("/api/items", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_items_conditional_after_delete(client):
+    """Test deleting an item invalidates list pages, with no Last-Modified."""
+    older = (await client.post("/api/items", json={"title": "Older"})).json()
+    await client.post("/api/items", json={"title": "Newer"})
+
+    response = await client.get("/api/items")
+    etag = response.headers["etag"]
+    assert "last-modified" not in response.headers
+
+    await client.delete(f"/api/items/{older['id']}")
+
+    # If-Modified-Since cannot see deletes, so lists ignore it
+    response = await client.get(
+        "/api/items", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+    assert response.status_code == 200
+    response = await client.get("/api/items", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Newer"]
+
+
+@pytest.mark.asyncio
+async def test_update_item_if_match(client):
+    """Test If-Match updates succeed once and stale ETags get 412."""
+    response = await client.post("/api/items", json={"title": "Shared"})
+    item = response.json()
+    assert item["version"] == 1
+    etag = (await client.get(f"/api/items/{item['id']}")).headers["etag"]
+
+    response = await client.put(
+        f"/api/items/{item['id']}",
+        json={"title": "First editor"},
+        headers={"If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert response.headers["etag"] != etag
+
+    # A second editor still holding the old ETag loses, and nothing changes
+    response = await client.put(
+        f"/api/items/{item['id']}",
+        json={"title": "Second editor"},
+        headers={"If-Match": etag},
+    )
+    assert response.status_code == 412
+    response = await client.get(f"/api/items/{item['id']}")
+    assert response.json()["title"] == "First editor"
+
+
+@pytest.mark.asyncio
+async def test_update_item_if_match_variants(client):
+    """Test wildcard, weak, malformed and missing-item If-Match handling."""
+    response = await client.post("/api/items", json={"title": "Item"})
+    item_id = response.json()["id"]
+
+    response = await client.put(
+        f"/api/items/{item_id}", json={"title": "Any"}, headers={"If-Match": "*"}
+    )
+    assert response.status_code == 200
+
+    for header in (f'W/"{item_id}-2"', '"garbage"', f'"{item_id + 1}-2"'):
+        response = await client.put(
+            f"/api/items/{item_id}", json={"title": "X"}, headers={"If-Match": header}
+        )
+        assert response.status_code == 412
+
+    response = await client.put(
+        "/api/items/999", json={"title": "X"}, headers={"If-Match": '"999-1"'}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_bumps_versions(client):
+    """Test bulk updates increment versions like single updates."""
+    response = await client.post("/api/items/bulk", json=[{"title": "Item"}])
+    item_id = response.json()[0]["id"]
+
+    response = await client.patch(
+        "/api/items/bulk", json=[{"id": item_id, "title": "Renamed"}]
+    )
+    assert response.json()[0]["version"] == 2
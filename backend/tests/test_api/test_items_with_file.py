@@ -0,0 +1,153 @@
+"""
+Tests for item endpoints with file uploads.
+"""
+import hashlib
+
+import pytest
+from sqlalchemy import select
+
+from app.models.item_file import ItemFile
+
+
+@pytest.mark.asyncio
+async def test_create_item_with_file(client, db_session, storage):
+    """Test an uploaded file is streamed to storage and recorded."""
+    content = b"hello world\n" * 10_000
+
+    response = await client.post(
+        "/api/items/with-file",
+        data={"title": "  With file  ", "description": "Attached"},
+        files={"file": ("notes.txt", content, "text/plain")},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "With file"
+    assert data["file_size"] == len(content)
+    assert data["file_type"] == "text/plain"
+
+    (item_file,) = (await db_session.scalars(select(ItemFile))).all()
+    assert item_file.item_id == data["id"]
+    assert item_file.sha256 == hashlib.sha256(content).hexdigest()
+    assert data["file_url"] == f"/api/items/{data['id']}/files/{item_file.id}"
+    assert storage.path(item_file.storage_key).read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_create_item_with_file_invalid_type(client, storage):
+    """Test disallowed content types are rejected before anything is stored."""
+    response = await client.post(
+        "/api/items/with-file",
+        data={"title": "Bad"},
+        files={"file": ("run.sh", b"echo", "application/x-sh")},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["field"] == "file"
+    assert not storage.root.exists()
+
+
+@pytest.mark.asyncio
+async def test_create_item_with_multiple_files(client, db_session, storage):
+    """Test every file of a multi-file upload is stored against one item."""
+    files = [
+        ("files", (f"page{i}.txt", f"page {i}".encode(), "text/plain"))
+        for i in range(3)
+    ]
+
+    response = await client.post(
+        "/api/items/with-multiple-files", data={"title": "Pages"}, files=files
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 3
+    assert {entry["id"] for entry in data} == {data[0]["id"]}
+
+    item_files = (await db_session.scalars(select(ItemFile))).all()
+    assert sorted(storage.path(f.storage_key).read_bytes() for f in item_files) == [
+        b"page 0",
+        b"page 1",
+        b"page 2",
+    ]
+
+
+@pytest.fixture
+async def uploaded(client):
+    """Upload a file and return its download URL and content."""
+    content = bytes(range(256)) * 1000
+    response = await client.post(
+        "/api/items/with-file",
+        data={"title": "Download"},
+        files={"file": ("report.pdf", content, "application/pdf")},
+    )
+    return response.json()["file_url"], content
+
+
+@pytest.mark.asyncio
+async def test_download_item_file(client, uploaded):
+    """Test downloading a whole file with a content-hash ETag."""
+    url, content = uploaded
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == f'"{hashlib.sha256(content).hexdigest()}"'
+
+    response = await client.head(url)
+    assert response.status_code == 200
+    assert response.headers["content-length"] == str(len(content))
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_download_item_file_not_modified(client, uploaded):
+    """Test a matching If-None-Match is answered with 304."""
+    url, _ = uploaded
+    etag = (await client.get(url)).headers["etag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = await client.get(url, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_download_item_file_ranges(client, uploaded):
+    """Test Range requests return the requested slice."""
+    url, content = uploaded
+    size = len(content)
+
+    response = await client.get(url, headers={"Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == content[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{size}"
+
+    response = await client.get(url, headers={"Range": "bytes=250000-"})
+    assert response.status_code == 206
+    assert response.content == content[250000:]
+
+    response = await client.get(url, headers={"Range": "bytes=-10"})
+    assert response.content == content[-10:]
+
+    response = await client.get(url, headers={"Range": f"bytes={size}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{size}"
+
+    # A stale If-Range falls back to the full body
+    response = await client.get(
+        url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+    )
+    assert response.status_code == 200
+    assert response.content == content
+
+
+@pytest.mark.asyncio
+async def test_download_item_file_not_found(client, uploaded):
+    """Test files are only reachable through the item they belong to."""
+    url, _ = uploaded
+    item_id, file_id = url.split("/")[3], url.split("/")[5]
+
+    response = await client.get(f"/api/items/{int(item_id) + 1}/files/{file_id}")
+    assert response.status_code == 404
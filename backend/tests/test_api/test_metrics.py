@@ -0,0 +1,105 @@
+"""
+Tests for the Prometheus metrics endpoint.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.core.database import create_engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    """Test metrics are served in the Prometheus text format."""
+    response = await client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_requests_total counter" in response.text
+
+
+@pytest.mark.asyncio
+async def test_requests_are_labelled_by_route_template(client: AsyncClient):
+    """Test item IDs collapse into one series per route."""
+    labels = {"method": "GET", "route": "/api/items/{item_id}"}
+    before = _sample("http_requests_total", status="404", **labels)
+    observed = _sample("http_request_duration_seconds_count", **labels)
+
+    for item_id in (101, 102, 103):
+        response = await client.get(f"/api/items/{item_id}")
+        assert response.status_code == 404
+
+    assert _sample("http_requests_total", status="404", **labels) == before + 3
+    assert _sample("http_request_duration_seconds_count", **labels) == observed + 3
+    assert _sample("http_requests_in_progress", **labels) == 0
+    text = (await client.get("/api/metrics")).text
+    assert 'route="/api/items/101"' not in text
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics(tmp_path):
+    """Test pool checkouts and occupancy are exported per pool."""
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'm.db'}", name="test")
+    try:
+        async with engine.connect():
+            assert _sample("db_pool_checked_out", pool="test") == 1
+        assert _sample("db_pool_checked_out", pool="test") == 0
+        assert _sample("db_pool_checkout_seconds_count", pool="test") == 1
+        assert _sample("db_pool_size", pool="test") == engine.pool.size()
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_upload_metrics(client: AsyncClient):
+    """Test uploaded files and bytes are counted."""
+    files, size = _sample("upload_files_total"), _sample("upload_bytes_total")
+
+    response = await client.post(
+        "/api/items/with-file",
+        data={"title": "Notes"},
+        files={"file": ("notes.txt", b"x" * 1234, "text/plain")},
+    )
+    assert response.status_code == 200
+
+    assert _sample("upload_files_total") == files + 1
+    assert _sample("upload_bytes_total") == size + 1234
+
+
+def test_multiprocess_aggregation(tmp_path):
+    """Test a scrape in one process sums the counters of every worker."""
+    env = {"PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PATH": ""}
+    record = (
+        "from app.core.metrics import UPLOAD_BYTES, UPLOAD_FILES; "
+        "UPLOAD_FILES.inc(); UPLOAD_BYTES.inc(100)"
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", record], cwd=BACKEND_DIR, env=env, check=True
+        )
+
+    scrape = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from app.core.metrics import render; print(render()[0].decode())",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert "upload_files_total 2.0" in scrape.stdout
+    assert "upload_bytes_total 200.0" in scrape.stdout
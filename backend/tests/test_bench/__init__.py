@@ -0,0 +1 @@
+# Load harness tests package
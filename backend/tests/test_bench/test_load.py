@@ -0,0 +1,50 @@
+"""
+Tests for the load-testing harness.
+"""
+import pytest
+from httpx import AsyncClient
+
+from bench.load import compare, percentile, run
+
+
+def test_percentile_nearest_rank():
+    """Test percentiles pick an observed value by nearest rank."""
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([0.2], 95) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_compare_with_baseline():
+    """Test relative changes are reported for scenarios in both runs."""
+    baseline = {"read": {"throughput_rps": 100.0, "p95_ms": 10.0, "error_rate": 0.0}}
+    current = {
+        "read": {"throughput_rps": 150.0, "p95_ms": 5.0, "error_rate": 0.01},
+        "list": {"throughput_rps": 1.0, "p95_ms": 1.0, "error_rate": 0.0},
+    }
+
+    [line] = compare(current, baseline)
+    assert "throughput +50.0%" in line
+    assert "p95 -50.0%" in line
+
+
+@pytest.mark.asyncio
+async def test_scenarios_run_without_errors(client: AsyncClient):
+    """Test every scenario drives the app successfully and is summarized."""
+    # The test client shares one session, so requests must not overlap
+    results = await run(
+        client,
+        ["read", "list", "crud", "upload"],
+        duration=30.0,
+        concurrency=1,
+        seed=1,
+        items=20,
+        upload_size=1024,
+        max_requests=20,
+    )
+
+    for name, result in results.items():
+        assert result["requests"] >= 20, name
+        assert result["error_rate"] == 0.0, name
+        assert result["p99_ms"] >= result["p95_ms"] >= result["p50_ms"] > 0
@@ -0,0 +1,73 @@
+"""
+Benchmark comparing validated and column-only list responses.
+"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.main import app
+from app.models.item import Item
+from app.repositories.item import ItemRepository
+from app.schemas.item import ItemResponse
+
+ROWS = 1_000
+REQUESTS = 50
+
+# The list endpoint as it was before the fast path: ORM entities validated
+# into models, then validated and encoded again by FastAPI
+validated_app = FastAPI()
+
+
+@validated_app.get("/api/items", response_model=list[ItemResponse])
+async def validated_items(limit: int = 100, db=Depends(get_db)):
+    items = await ItemRepository(db).get_all(limit=limit)
+    return [ItemResponse.model_validate(item) for item in items]
+
+
+async def _requests_per_second(client: AsyncClient, url: str) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = await client.get(url)
+        assert response.status_code == 200
+    return REQUESTS / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_list_serialization_throughput(client, db_session, monkeypatch):
+    """Both paths return identical JSON; print requests/sec for each."""
+    monkeypatch.setattr(settings, "ITEM_CACHE_ENABLED", False)
+    base = datetime(2024, 1, 1)
+    await db_session.execute(
+        insert(Item),
+        [
+            {
+                "title": f"Item {i}",
+                "description": f"Description {i}",
+                "is_active": True,
+                "created_at": base + timedelta(seconds=i),
+            }
+            for i in range(ROWS)
+        ],
+    )
+    await db_session.commit()
+
+    url = f"/api/items?limit={ROWS}"
+    validated_app.dependency_overrides = app.dependency_overrides
+    async with AsyncClient(app=validated_app, base_url="http://test") as baseline:
+        expected = (await baseline.get(url)).json()
+        assert (await client.get(url)).json() == expected
+        assert len(expected) == ROWS
+
+        before = await _requests_per_second(baseline, url)
+    after = await _requests_per_second(client, url)
+
+    print(f"\n{'path':>10} {'req/s':>8}")
+    print(f"{'validated':>10} {before:>8.1f}")
+    print(f"{'columns':>10} {after:>8.1f}")
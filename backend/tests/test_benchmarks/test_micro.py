@@ -0,0 +1,159 @@
+"""
+Micro-benchmarks for the item read path, run with pytest-benchmark.
+
+Datasets default to 1k rows; set BENCH_ROWS=1000,100000,1000000 for the
+large ones. Plain test runs execute each benchmark once (see
+--benchmark-disable in pyproject.toml); `make bench-micro` measures and
+saves a baseline and `make bench-micro-compare` fails on regressions.
+"""
+import os
+from datetime import datetime, timedelta
+from io import BytesIO
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.datastructures import Headers, UploadFile
+
+from app.core.config import settings
+from app.core.database import Base
+from app.core.responses import ORJSONResponse
+from app.models.item import Item
+from app.repositories.item import ItemRepository, count_cache
+from app.schemas.item import ItemResponse
+from app.schemas.item_with_file import validate_file
+from app.services.item import ItemService
+
+ROWS = [int(rows) for rows in os.environ.get("BENCH_ROWS", "1000").split(",")]
+PAGE = 100
+SEED_CHUNK = 10_000
+
+item_list = TypeAdapter(list[ItemResponse])
+
+
+def _label(rows: int) -> str:
+    return f"{rows // 1_000_000}M" if rows >= 1_000_000 else f"{rows // 1000}k"
+
+
+@pytest.fixture(scope="module", params=ROWS, ids=_label)
+async def sessionmaker(request, tmp_path_factory):
+    """A SQLite database seeded with the same `rows` items on every run."""
+    rows = request.param
+    path = tmp_path_factory.mktemp("bench") / f"items-{rows}.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        base = datetime(2024, 1, 1)
+        for start in range(0, rows, SEED_CHUNK):
+            await conn.execute(
+                insert(Item),
+                [
+                    {
+                        "title": f"Item {i:07d}",
+                        "description": f"Description {i}",
+                        "is_active": i % 10 != 0,
+                        "created_at": base + timedelta(seconds=i),
+                        "updated_at": base + timedelta(seconds=i),
+                    }
+                    for i in range(start, min(start + SEED_CHUNK, rows))
+                ],
+            )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def run(event_loop):
+    """Run a coroutine function to completion; benchmarks time sync callables."""
+    return lambda make_coro: event_loop.run_until_complete(make_coro())
+
+
+def test_repository_get_all(benchmark, run, sessionmaker):
+    """ORM entities for the first page."""
+
+    async def get_all():
+        async with sessionmaker() as session:
+            return await ItemRepository(session).get_all(limit=PAGE)
+
+    assert len(benchmark(run, get_all)) == PAGE
+
+
+def test_repository_get_all_rows(benchmark, run, sessionmaker):
+    """Column rows for the first page, as the list endpoint reads them."""
+
+    async def get_all_rows():
+        async with sessionmaker() as session:
+            return await ItemRepository(session).get_all_rows(limit=PAGE)
+
+    assert len(benchmark(run, get_all_rows)) == PAGE
+
+
+def test_repository_count(benchmark, run, sessionmaker, monkeypatch):
+    """Exact count of active items, uncached."""
+    monkeypatch.setattr(count_cache, "ttl", 0)
+
+    async def count():
+        async with sessionmaker() as session:
+            return await ItemRepository(session).count()
+
+    assert benchmark(run, count) > 0
+
+
+def test_service_get_items(benchmark, run, sessionmaker, monkeypatch):
+    """The list endpoint's service call, without the item cache."""
+    monkeypatch.setattr(settings, "ITEM_CACHE_ENABLED", False)
+
+    async def get_items():
+        async with sessionmaker() as session:
+            return await ItemService(session).get_items(limit=PAGE)
+
+    items, _ = benchmark(run, get_items)
+    assert len(items) == PAGE
+
+
+def test_service_get_items_validated(benchmark, run, sessionmaker):
+    """The former list path: one `ItemResponse.model_validate` per entity."""
+
+    async def get_items_validated():
+        async with sessionmaker() as session:
+            items = await ItemRepository(session).get_all(limit=PAGE)
+            return [ItemResponse.model_validate(item) for item in items]
+
+    assert len(benchmark(run, get_items_validated)) == PAGE
+
+
+@pytest.fixture(scope="module")
+def page(sessionmaker, event_loop):
+    """One page of items as dicts, for the encoding benchmarks."""
+
+    async def get_all_rows():
+        async with sessionmaker() as session:
+            return await ItemRepository(session).get_all_rows(limit=PAGE)
+
+    return event_loop.run_until_complete(get_all_rows())
+
+
+def test_encode_rows_orjson(benchmark, page):
+    """Encoding column rows the way the list endpoint does."""
+    body = benchmark(ORJSONResponse(None).render, page)
+    assert len(orjson.loads(body)) == PAGE
+
+
+def test_encode_models_pydantic(benchmark, page):
+    """Encoding `list[ItemResponse]` with pydantic, as response_model would."""
+    models = [ItemResponse.model_validate(row) for row in page]
+    body = benchmark(item_list.dump_json, models)
+    assert orjson.loads(body) == orjson.loads(ORJSONResponse(page).body)
+
+
+def test_validate_file(benchmark):
+    """Upload validation for an allowed file."""
+    upload = UploadFile(
+        BytesIO(b"x" * 1024),
+        size=1024,
+        filename="notes.txt",
+        headers=Headers({"content-type": "text/plain"}),
+    )
+    assert benchmark(validate_file, upload) is upload
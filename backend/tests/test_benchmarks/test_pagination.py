@@ -0,0 +1,59 @@
+"""
+Benchmark comparing OFFSET and keyset pagination at increasing depths.
+"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.item import Item
+from app.repositories.item import ItemRepository
+
+ROWS = 20_000
+PAGE_SIZE = 100
+DEPTHS = [0, 1_000, 5_000, 10_000, 19_000]
+
+
+async def _timed(coro) -> tuple[list[Item], float]:
+    start = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_offset_vs_keyset_latency(db_session):
+    """Keyset pages return the same rows as OFFSET pages at every depth."""
+    base = datetime(2024, 1, 1)
+    await db_session.execute(
+        insert(Item),
+        [
+            {
+                "title": f"Item {i}",
+                "is_active": True,
+                "created_at": base + timedelta(seconds=i),
+            }
+            for i in range(ROWS)
+        ],
+    )
+    await db_session.commit()
+    repository = ItemRepository(db_session)
+
+    print(f"\n{'depth':>8} {'offset ms':>10} {'keyset ms':>10}")
+    for depth in DEPTHS:
+        # The keyset position is the last row of the previous page
+        after = None
+        if depth:
+            (previous,) = await repository.get_all(skip=depth - 1, limit=1)
+            after = (previous.created_at, previous.id)
+
+        by_offset, offset_time = await _timed(
+            repository.get_all(skip=depth, limit=PAGE_SIZE)
+        )
+        by_keyset, keyset_time = await _timed(
+            repository.get_all(limit=PAGE_SIZE, after=after)
+        )
+
+        assert [item.id for item in by_keyset] == [item.id for item in by_offset]
+        print(f"{depth:>8} {offset_time * 1000:>10.2f} {keyset_time * 1000:>10.2f}")
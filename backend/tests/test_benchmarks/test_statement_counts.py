@@ -0,0 +1,140 @@
+"""
+Statement-count budgets for item endpoints.
+
+Each request should cost a fixed number of SQL round trips regardless of
+payload, so a regression shows up here before it shows up as latency.
+"""
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+
+from app.models.item import Item
+from app.repositories.item import _filtered
+from app.schemas.item import ItemFilter
+
+
+@pytest.fixture
+def statements(test_engine):
+    """Record every SQL statement sent through the test engine."""
+    recorded: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+async def item_id(client):
+    """Create an item before statements are recorded."""
+    response = await client.post("/api/items", json={"title": "Budget"})
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_get_item_statements(client, item_id, statements):
+    """Test reading an item costs one statement."""
+    response = await client.get(f"/api/items/{item_id}")
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_sparse_fields_select_only_requested_columns(client, item_id, statements):
+    """Test fields= keeps unrequested columns out of the SELECT."""
+    response = await client.get(f"/api/items/{item_id}?fields=title")
+    assert response.status_code == 200
+    response = await client.get("/api/items?fields=title")
+    assert response.status_code == 200
+
+    assert len(statements) == 2
+    for statement in statements:
+        assert "items.description" not in statement.split("FROM")[0]
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_item_statements(client, item_id, statements):
+    """Test a revalidated item is answered from its version alone."""
+    response = await client.get(f"/api/items/{item_id}")
+    statements.clear()
+
+    response = await client.get(
+        f"/api/items/{item_id}", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert (
+        statements[0].split("FROM")[0].strip()
+        == "SELECT items.version, items.updated_at"
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_item_statements(client, item_id, statements):
+    """Test updating an item costs one UPDATE ... RETURNING."""
+    response = await client.put(f"/api/items/{item_id}", json={"title": "New"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "New"
+    assert len(statements) == 1
+    assert "RETURNING" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_update_missing_item_statements(client, statements):
+    """Test a missing item is detected by the UPDATE itself."""
+    response = await client.put("/api/items/999", json={"title": "New"})
+    assert response.status_code == 404
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_item_statements(client, item_id, statements):
+    """Test deleting an item costs one statement."""
+    response = await client.delete(f"/api/items/{item_id}")
+    assert response.status_code == 204
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_title_prefix_is_a_bounded_range(client, item_id, statements):
+    """Test title_prefix gives the title index an upper bound to stop at."""
+    response = await client.get("/api/items?title_prefix=Bud&sort=title")
+    assert response.status_code == 200
+    assert "items.title < ?" in statements[0]
+
+    # On PostgreSQL both bounds use the "C" collation of migration 009
+    query = _filtered(
+        select(Item.id), True, ItemFilter(title_prefix="Bud"), "postgresql"
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert '(items.title COLLATE "C") >=' in sql
+    assert '(items.title COLLATE "C") <' in sql
+
+
+ENDPOINT_BUDGETS = [
+    ("GET", "/api/items", 1),
+    ("GET", "/api/items?sort=title&fields=title", 1),
+    ("GET", "/api/items/count", 1),
+    ("GET", "/api/items/search?q=Budget", 1),
+    ("GET", "/api/items/export?format=csv", 1),
+    ("GET", "/api/items/1", 1),
+    ("PUT", "/api/items/1", 1),
+    ("DELETE", "/api/items/1", 1),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("method", "url", "budget"), ENDPOINT_BUDGETS)
+async def test_endpoint_statement_budgets(client, sql_budget, method, url, budget):
+    """Test each endpoint stays within its statement budget for many items."""
+    response = await client.post(
+        "/api/items/bulk", json=[{"title": f"Budget {i}"} for i in range(20)]
+    )
+    assert response.status_code == 201
+
+    with sql_budget(budget):
+        kwargs = {"json": {"title": "New"}} if method == "PUT" else {}
+        response = await client.request(method, url, **kwargs)
+    assert response.status_code < 300
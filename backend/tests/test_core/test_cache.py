@@ -0,0 +1,65 @@
+"""
+Tests for the async cache backends.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import MemoryCache, RedisCache
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def cache(request):
+    """Each cache backend, with Redis faked in-process."""
+    if request.param == "memory":
+        return MemoryCache(max_entries=2)
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisCache(client=fakeredis.FakeAsyncRedis(), prefix="test:")
+
+
+@pytest.mark.asyncio
+async def test_get_set_delete(cache):
+    """Test values round-trip and deletes drop them."""
+    assert await cache.get("a") is None
+    await cache.set("a", b"1", ttl=60)
+    assert await cache.get("a") == b"1"
+
+    await cache.delete("a", "missing")
+    assert await cache.get("a") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_ratio": 1 / 3}
+
+
+@pytest.mark.asyncio
+async def test_entries_expire(cache):
+    """Test entries are gone once their ttl passes."""
+    await cache.set("a", b"1", ttl=0.01)
+    await asyncio.sleep(0.05)
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_counters_and_clear(cache):
+    """Test counters increment independently of entries and clear resets both."""
+    assert await cache.counter("generation") == 0
+    assert await cache.incr("generation") == 1
+    assert await cache.counter("generation") == 1
+    await cache.set("a", b"1", ttl=60)
+
+    await cache.clear()
+    assert await cache.counter("generation") == 0
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """Test the in-process cache stays within max_entries."""
+    cache = MemoryCache(max_entries=2)
+    await cache.set("a", b"1", ttl=60)
+    await cache.set("b", b"2", ttl=60)
+    await cache.get("a")
+    await cache.set("c", b"3", ttl=60)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1"
+    assert await cache.get("c") == b"3"
@@ -0,0 +1,60 @@
+"""
+Tests for ranged storage file responses.
+"""
+import pytest
+
+from app.core.file_response import (
+    RangeNotSatisfiable,
+    StorageFileResponse,
+    parse_range,
+)
+from app.storage import LocalStorage
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", (0, 100)),
+        ("bytes=10-", (10, 1000)),
+        ("bytes=-100", (900, 1000)),
+        ("bytes=-5000", (0, 1000)),
+        ("bytes=990-5000", (990, 1000)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header, expected):
+    """Test single byte ranges are parsed and clamped to the file size."""
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0", "bytes=5-4"])
+def test_parse_range_not_satisfiable(header):
+    """Test ranges outside the file are rejected."""
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, 1000)
+
+
+@pytest.mark.asyncio
+async def test_local_file_uses_zero_copy_send(tmp_path):
+    """Test local files are handed to servers that support zero-copy send."""
+    storage = LocalStorage(tmp_path)
+    storage.path("file.bin").write_bytes(b"0123456789")
+    messages = []
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message = {**message, "file": message["file"].name}
+        messages.append(message)
+
+    response = StorageFileResponse(storage, "file.bin", 2, 6, status_code=206)
+    scope = {"type": "http", "extensions": {"http.response.zerocopysend": {}}}
+    await response(scope, None, send)
+
+    assert messages[-1] == {
+        "type": "http.response.zerocopysend",
+        "file": str(storage.path("file.bin")),
+        "offset": 2,
+        "count": 4,
+    }
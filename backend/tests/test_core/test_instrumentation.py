@@ -0,0 +1,67 @@
+"""
+Tests for per-request SQL instrumentation.
+"""
+
+import logging
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.instrumentation import capture_sql
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client: AsyncClient):
+    """Test responses report their statement count and DB time."""
+    response = await client.get("/api/items/count")
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    assert 'desc="1 statements"' in timing
+    assert "db-slowest;dur=" in timing
+
+
+@pytest.mark.asyncio
+async def test_request_log_fields(client: AsyncClient, caplog):
+    """Test each request is logged with structured DB fields."""
+    with caplog.at_level(logging.INFO, logger="app.core.instrumentation"):
+        await client.get("/api/items")
+
+    record = caplog.records[-1]
+    assert record.path == "/api/items"
+    assert record.status == 200
+    assert record.db_statements == 1
+    assert record.db_ms >= record.db_slowest_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_captures_nest(db_session: AsyncSession):
+    """Test statements count towards every enclosing capture."""
+    with capture_sql() as outer:
+        await db_session.execute(text("SELECT 1"))
+        with capture_sql() as inner:
+            await db_session.execute(text("SELECT 2"))
+
+    assert (outer.statements, inner.statements) == (2, 1)
+    assert inner.slowest_statement == "SELECT 2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("debug", [True, False])
+async def test_repeated_statement_warning(
+    db_session: AsyncSession, caplog, monkeypatch, debug
+):
+    """Test a statement repeated in a loop is flagged in debug mode only."""
+    monkeypatch.setattr(settings, "DEBUG", debug)
+    monkeypatch.setattr(settings, "SQL_REPEAT_WARN_THRESHOLD", 3)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.instrumentation"):
+        with capture_sql():
+            for i in range(5):
+                await db_session.execute(text("SELECT :i"), {"i": i})
+
+    warnings = [r for r in caplog.records if "N+1" in r.getMessage()]
+    assert len(warnings) == (1 if debug else 0)
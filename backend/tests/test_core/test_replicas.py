@@ -0,0 +1,145 @@
+"""
+Tests for read replica routing.
+"""
+
+import math
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import replicas as replicas_module
+from app.core.database import Base
+from app.core.replicas import PRIMARY_COOKIE, ReplicaSet
+from app.models.item import Item
+from app.services.item import GENERATION_KEY
+
+
+@pytest.fixture
+async def replica_set(tmp_path, monkeypatch):
+    """Two SQLite replicas, each holding one item titled after the replica."""
+    urls = [f"sqlite+aiosqlite:///{tmp_path / f'replica{i}.db'}" for i in range(2)]
+    replica_set = ReplicaSet(urls, max_lag=5.0, check_interval=0.0)
+    for i, replica in enumerate(replica_set.replicas):
+        async with replica.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with replica.sessionmaker() as session:
+            session.add(Item(title=f"replica-{i}"))
+            await session.commit()
+    monkeypatch.setattr(replicas_module, "read_replicas", replica_set)
+    yield replica_set
+    await replica_set.dispose()
+
+
+@pytest.fixture
+async def primary_item(db_session: AsyncSession):
+    """An item that only exists on the primary."""
+    db_session.add(Item(title="primary"))
+    await db_session.commit()
+
+
+async def _title(client: AsyncClient) -> str:
+    response = await client.get("/api/items/1")
+    assert response.status_code == 200
+    return response.json()["title"]
+
+
+@pytest.mark.asyncio
+async def test_reads_round_robin_over_replicas(
+    client: AsyncClient, replica_set, primary_item
+):
+    """Test reads alternate between replicas and stay off the primary."""
+    titles = [await _title(client) for _ in range(4)]
+    assert titles == ["replica-0", "replica-1", "replica-0", "replica-1"]
+
+    response = await client.get("/api/items/count")
+    assert response.json() == {"count": 1}
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_is_skipped(
+    client: AsyncClient, replica_set, primary_item, monkeypatch
+):
+    """Test a replica over the lag limit gets no reads until it catches up."""
+    lagging = replica_set.replicas[0]
+    monkeypatch.setattr(lagging, "measure_lag", _returning(60.0))
+    assert [await _title(client) for _ in range(3)] == ["replica-1"] * 3
+
+    monkeypatch.setattr(lagging, "measure_lag", _returning(0.5))
+    assert {await _title(client) for _ in range(2)} == {"replica-0", "replica-1"}
+
+
+@pytest.mark.asyncio
+async def test_unavailable_replicas_fall_back_to_primary(
+    client: AsyncClient, replica_set, primary_item, monkeypatch
+):
+    """Test reads go to the primary when no replica can be used."""
+
+    async def unreachable():
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(replica_set.replicas[0], "measure_lag", unreachable)
+    monkeypatch.setattr(replica_set.replicas[1], "measure_lag", _returning(math.inf))
+
+    assert await _title(client) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_writes_pin_reads_to_primary(client: AsyncClient, replica_set):
+    """Test a client reads its own write from the primary right after writing."""
+    response = await client.post("/api/items", json={"title": "mine"})
+    assert response.status_code == 201
+    assert PRIMARY_COOKIE in response.cookies
+
+    assert await _title(client) == "mine"
+
+    # Without the cookie, reads go back to the replicas
+    client.cookies.clear()
+    response = await client.get("/api/items/1", params={"fields": "title"})
+    assert response.json()["title"] == "replica-0"
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_do_not_pin(client: AsyncClient, replica_set):
+    """Test rejected writes leave reads on the replicas."""
+    response = await client.post("/api/items", json={})
+    assert response.status_code == 422
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+@pytest.mark.asyncio
+async def test_replica_reads_do_not_fill_cache(
+    client: AsyncClient, replica_set, item_cache
+):
+    """Test items read from a replica are not written to the item cache."""
+    await _title(client)
+    await client.get("/api/items")
+
+    assert item_cache.stats()["misses"] >= 1
+    generation = await item_cache.counter(GENERATION_KEY)
+    assert await item_cache.get(f"item:{generation}:1") is None
+
+
+@pytest.mark.asyncio
+async def test_replica_counts_do_not_fill_count_cache(
+    client: AsyncClient, replica_set, primary_item
+):
+    """Test a lagging replica's count is not served to a pinned writer."""
+    response = await client.post("/api/items", json={"title": "mine"})
+    assert response.status_code == 201
+    pinned = dict(client.cookies)
+
+    client.cookies.clear()
+    response = await client.get("/api/items/count")
+    assert response.json() == {"count": 1}
+
+    client.cookies.update(pinned)
+    response = await client.get("/api/items/count")
+    assert response.json() == {"count": 2}
+
+
+def _returning(lag: float):
+    async def measure_lag():
+        return lag
+
+    return measure_lag
@@ -0,0 +1,84 @@
+"""
+Tests for the in-memory static asset cache.
+"""
+
+import gzip
+
+import pytest
+
+import app.main as main
+from app.core.static import IMMUTABLE_CACHE_CONTROL, StaticAssets
+
+INDEX_HTML = b"<!doctype html><html><body>" + b"<div></div>" * 200 + b"</body></html>"
+
+
+@pytest.fixture
+def static_assets(tmp_path, monkeypatch):
+    """Serve a fake frontend build from a temporary directory."""
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_bytes(INDEX_HTML)
+    (tmp_path / "assets" / "index-1a2b3c.js").write_text("console.log(1);" * 100)
+    assets = StaticAssets(tmp_path)
+    monkeypatch.setattr(main, "static_assets", assets)
+    return assets
+
+
+@pytest.mark.asyncio
+async def test_spa_routes_serve_cached_index(client, static_assets):
+    """Test the index and client-side routes are served with revalidation."""
+    response = await client.get("/items/42", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.content == INDEX_HTML
+    assert response.headers["cache-control"] == "no-cache"
+
+    response = await client.get(
+        "/", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_assets_are_precompressed_and_immutable(client, static_assets):
+    """Test fingerprinted assets are served compressed with immutable caching."""
+    response = await client.get(
+        "/assets/index-1a2b3c.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.text == "console.log(1);" * 100
+
+    response = await client.get("/assets/missing.js")
+    assert response.status_code == 404
+
+
+def test_accept_encoding_negotiation(tmp_path):
+    """Test brotli is preferred when accepted and q=0 codings are skipped."""
+    pytest.importorskip("brotli")
+    (tmp_path / "index.html").write_bytes(INDEX_HTML)
+    assets = StaticAssets(tmp_path)
+
+    class FakeRequest:
+        def __init__(self, accept_encoding):
+            self.headers = {"accept-encoding": accept_encoding}
+
+    response = assets.response(FakeRequest("gzip, br"), "index.html")
+    assert response.headers["content-encoding"] == "br"
+
+    response = assets.response(FakeRequest("br;q=0, gzip;q=0.5"), "index.html")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(response.body) == INDEX_HTML
+
+
+def test_reload_picks_up_changes(tmp_path):
+    """Test reloading replaces cached content after a rebuild."""
+    (tmp_path / "index.html").write_text("old")
+    assets = StaticAssets(tmp_path)
+    assert assets.exists("index.html")
+    assert not assets.exists("vite.svg")
+
+    (tmp_path / "index.html").write_text("new")
+    (tmp_path / "vite.svg").write_text("<svg/>")
+    assets.load()
+    assert assets.exists("vite.svg")
+    assert assets._assets["index.html"].content == b"new"
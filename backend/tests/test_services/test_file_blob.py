@@ -0,0 +1,125 @@
+"""
+Tests for content-addressed file storage.
+"""
+import hashlib
+import io
+from datetime import timedelta
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import func, select
+
+from app.models.file_blob import FileBlob
+from app.models.item_file import ItemFile
+from app.services.file_blob import FileBlobService, blob_key
+
+
+async def _upload(client, title: str, content: bytes) -> dict:
+    response = await client.post(
+        "/api/items/with-file",
+        data={"title": title},
+        files={"file": ("doc.pdf", content, "application/pdf")},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_uploads_share_one_blob(client, db_session, storage):
+    """Test the same content uploaded twice is written to storage once."""
+    first = await _upload(client, "First", b"%PDF same content")
+    second = await _upload(client, "Second", b"%PDF same content")
+    assert first["id"] != second["id"]
+
+    item_files = (await db_session.scalars(select(ItemFile))).all()
+    assert len(item_files) == 2
+    assert {f.storage_key for f in item_files} == {blob_key(item_files[0].sha256)}
+    assert await db_session.scalar(select(func.count()).select_from(FileBlob)) == 1
+    assert len([p for p in storage.root.rglob("*") if p.is_file()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_multiple_files_with_same_content(client, db_session, storage):
+    """Test duplicates within a single multi-file upload are written once."""
+    files = [("files", (f"copy{i}.txt", b"same", "text/plain")) for i in range(3)]
+    response = await client.post(
+        "/api/items/with-multiple-files", data={"title": "Copies"}, files=files
+    )
+    assert response.status_code == 200
+
+    assert await db_session.scalar(select(func.count()).select_from(ItemFile)) == 3
+    assert len([p for p in storage.root.rglob("*") if p.is_file()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_collect_garbage(client, db_session, storage):
+    """Test only blobs with no remaining references are collected."""
+    kept = await _upload(client, "Kept", b"%PDF kept")
+    dropped = await _upload(client, "Dropped", b"%PDF dropped")
+
+    response = await client.delete(f"/api/items/{dropped['id']}")
+    assert response.status_code == 204
+
+    service = FileBlobService(db_session, storage)
+    # Within the grace period nothing is collected
+    assert await service.collect_garbage() == 0
+    assert await service.collect_garbage(grace=timedelta(seconds=-1)) == 1
+
+    (blob,) = (await db_session.scalars(select(FileBlob))).all()
+    (item_file,) = (await db_session.scalars(select(ItemFile))).all()
+    assert item_file.item_id == kept["id"]
+    assert blob.sha256 == item_file.sha256
+    assert [p for p in storage.root.rglob("*") if p.is_file()] == [
+        storage.path(blob.storage_key)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_collect_garbage_deletes_objects_before_commit(
+    client, db_session, storage
+):
+    """Test objects are deleted while the blob rows are still locked."""
+    item = await _upload(client, "Dropped", b"%PDF dropped")
+    await client.delete(f"/api/items/{item['id']}")
+
+    delete = storage.delete
+    in_transaction = []
+
+    async def record(key):
+        in_transaction.append(db_session.in_transaction())
+        await delete(key)
+
+    storage.delete = record
+    service = FileBlobService(db_session, storage)
+    assert await service.collect_garbage(grace=timedelta(seconds=-1)) == 1
+    assert in_transaction == [True]
+    assert not db_session.in_transaction()
+    assert await db_session.scalar(select(func.count()).select_from(FileBlob)) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_keeps_stored_blobs_for_gc(db_session, storage):
+    """Test a failed multi-file upload records, not deletes, blobs it stored."""
+    save = storage.save
+
+    async def fail_one(key, chunks, **kwargs):
+        if key == blob_key(hashlib.sha256(b"broken").hexdigest()):
+            raise OSError("disk full")
+        return await save(key, chunks, **kwargs)
+
+    storage.save = fail_one
+    uploads = [
+        UploadFile(io.BytesIO(content), filename="f.txt")
+        for content in (b"stored", b"broken")
+    ]
+    with pytest.raises(OSError):
+        await FileBlobService(db_session, storage).store_uploads(uploads)
+
+    # A concurrent upload of the same content may already be using it
+    (blob,) = (await db_session.scalars(select(FileBlob))).all()
+    assert blob.sha256 == hashlib.sha256(b"stored").hexdigest()
+    assert storage.path(blob.storage_key).read_bytes() == b"stored"
+
+    service = FileBlobService(db_session, storage)
+    assert await service.collect_garbage(grace=timedelta(seconds=-1)) == 1
+    assert not storage.path(blob.storage_key).exists()
@@ -0,0 +1,66 @@
+"""
+Tests for the item service's cache invalidation and change events.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.cache import MemoryCache
+from app.core.events import EventBroadcaster
+from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from app.services.item import GENERATION_KEY, ItemService
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_does_not_cache_stale_item(db_session, monkeypatch):
+    """Test a read that loaded an item before a write cannot cache it after."""
+    cache = MemoryCache()
+    item = await ItemService(db_session, cache=cache).create_item(
+        ItemCreate(title="v1")
+    )
+
+    reader = ItemService(db_session, cache=cache)
+    get_by_id = reader.repository.get_by_id
+
+    async def load_then_lose_race(item_id: int):
+        loaded = ItemResponse.model_validate(await get_by_id(item_id))
+        writer = ItemService(db_session, cache=cache)
+        await writer.update_item(item_id, ItemUpdate(title="v2"))
+        return SimpleNamespace(**loaded.model_dump())
+
+    monkeypatch.setattr(reader.repository, "get_by_id", load_then_lose_race)
+    assert (await reader.get_item(item.id)).title == "v1"
+
+    fresh = await ItemService(db_session, cache=cache).get_item(item.id)
+    assert fresh.title == "v2"
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_write_invalidates_committed_chunks(
+    db_session, monkeypatch
+):
+    """Test chunks committed before a failure are invalidated and announced."""
+    cache, events = MemoryCache(), EventBroadcaster(max_queue=10)
+    service = ItemService(db_session, cache=cache, events=events)
+    commit = db_session.commit
+    commits = 0
+
+    async def fail_second_commit():
+        nonlocal commits
+        commits += 1
+        if commits == 2:
+            raise RuntimeError("connection lost")
+        await commit()
+
+    monkeypatch.setattr(db_session, "commit", fail_second_commit)
+    async with events.subscribe() as subscription:
+        with pytest.raises(RuntimeError):
+            await service.bulk_create_items(
+                [ItemCreate(title="First"), ItemCreate(title="Second")],
+                chunk_size=1,
+            )
+        event = await subscription.get(timeout=1.0)
+
+    assert event["type"] == "created" and len(event["ids"]) == 1
+    assert subscription.queue.empty()
+    assert await cache.counter(GENERATION_KEY) == 1
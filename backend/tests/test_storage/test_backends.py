@@ -0,0 +1,96 @@
+"""
+Tests for file storage backends.
+"""
+import asyncio
+import hashlib
+
+import pytest
+
+from app.storage import LocalStorage, S3Storage
+
+
+async def _chunks(data: bytes, size: int = 1024):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.asyncio
+async def test_local_storage_save(tmp_path):
+    """Test local storage writes chunks and reports size and hash."""
+    storage = LocalStorage(tmp_path)
+    data = bytes(range(256)) * 100
+
+    stored = await storage.save("ab/file.bin", _chunks(data))
+    assert stored.size == len(data)
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / "ab" / "file.bin").read_bytes() == data
+    assert b"".join([c async for c in storage.read("ab/file.bin", 10, 70000)]) == (
+        data[10:70000]
+    )
+
+    await storage.delete("ab/file.bin")
+    assert not (tmp_path / "ab" / "file.bin").exists()
+
+
+@pytest.mark.asyncio
+async def test_local_storage_max_size(tmp_path):
+    """Test oversized uploads are aborted without leaving partial files."""
+    storage = LocalStorage(tmp_path)
+
+    with pytest.raises(ValueError):
+        await storage.save("big.bin", _chunks(b"x" * 5000), max_size=4096)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_local_storage_concurrent_saves_of_one_key(tmp_path):
+    """Test concurrent writes of the same key do not clobber each other."""
+    storage = LocalStorage(tmp_path)
+    data = b"same content" * 1000
+
+    results = await asyncio.gather(
+        *(storage.save("blobs/ab/x", _chunks(data, 100)) for _ in range(2))
+    )
+    assert [stored.size for stored in results] == [len(data), len(data)]
+    assert (tmp_path / "blobs" / "ab" / "x").read_bytes() == data
+    assert [p.name for p in (tmp_path / "blobs" / "ab").iterdir()] == ["x"]
+
+
+def test_local_storage_rejects_escaping_keys(tmp_path):
+    """Test keys cannot point outside the storage root."""
+    with pytest.raises(ValueError):
+        LocalStorage(tmp_path).path("../outside.txt")
+
+
+@pytest.fixture
+def s3_storage(monkeypatch):
+    """Create an S3 storage backend against moto's in-memory S3."""
+    moto = pytest.importorskip("moto")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+
+    with moto.mock_aws():
+        storage = S3Storage(bucket="uploads", region="us-east-1")
+        storage.client.create_bucket(Bucket="uploads")
+        yield storage
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1024, 9 * 1024 * 1024])
+async def test_s3_storage_save(s3_storage, size):
+    """Test S3 storage handles single-PUT and multipart uploads."""
+    data = b"0123456789abcdef" * (size // 16)
+
+    stored = await s3_storage.save("ab/file.bin", _chunks(data, 256 * 1024))
+    assert stored.size == len(data)
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+
+    body = s3_storage.client.get_object(Bucket="uploads", Key="ab/file.bin")["Body"]
+    assert body.read() == data
+    assert b"".join([c async for c in s3_storage.read("ab/file.bin", 5, 900)]) == (
+        data[5:900]
+    )
+
+    await s3_storage.delete("ab/file.bin")
+    listing = s3_storage.client.list_objects_v2(Bucket="uploads")
+    assert listing["KeyCount"] == 0